@@ -1,8 +1,8 @@
 import datetime
-import statistics
 import webbrowser
 from pathlib import Path
 
+import numpy as np
 import plotly.graph_objs as go
 from jinja2 import PackageLoader, Environment
 from plotly.offline import plot, iplot
@@ -28,12 +28,6 @@ def iplot_benchmark_results(ts_agent_list=None, ga_agent=None):
     :returns: None
     """
     if ts_agent_list is not None and all(ts_agent.benchmark for ts_agent in ts_agent_list):
-        best_makespans_per_ts_agent = []
-        iterations_per_ts_agent = []
-        for ts_agent in ts_agent_list:
-            best_makespans_per_ts_agent.append(ts_agent.min_makespan_coordinates[1])
-            iterations_per_ts_agent.append(ts_agent.benchmark_iterations)
-
         # create traces for plots
         makespans_traces, makespans_layout, \
         nh_sizes_traces, nh_sizes_layout, \
@@ -82,21 +76,12 @@ def output_benchmark_results(output_dir, ts_agent_list=None, ga_agent=None, titl
     if title is None:
         title = "Benchmark Run {}".format(datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
 
-    output_dir = Path(output_dir)
+    # resolve the path once, it is used for the plots, the template and the browser
+    output_dir = Path(output_dir).resolve()
 
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
 
-    def compute_stats(lst):
-        return {
-            'min': round(min(lst)),
-            'median': round(statistics.median(lst)),
-            'max': round(max(lst)),
-            'std': round(statistics.stdev(lst)) if len(lst) > 1 else 0,
-            'var': round(statistics.variance(lst)) if len(lst) > 1 else 0,
-            'mean': round(statistics.mean(lst))
-        }
-
     # tabu search results
     if ts_agent_list is not None:
         _create_ts_plots(ts_agent_list, output_dir)
@@ -108,9 +93,9 @@ def output_benchmark_results(output_dir, ts_agent_list=None, ga_agent=None, titl
             ts_initial_makespans.append(ts_agent.initial_solution.makespan)
             ts_iterations.append(ts_agent.benchmark_iterations)
 
-        ts_result_makespans_stats = compute_stats(ts_result_makespans)
-        ts_initial_makespans_stats = compute_stats(ts_initial_makespans)
-        ts_iterations_stats = compute_stats(ts_iterations)
+        ts_result_makespans_stats = _compute_stats(ts_result_makespans)
+        ts_initial_makespans_stats = _compute_stats(ts_initial_makespans)
+        ts_iterations_stats = _compute_stats(ts_iterations)
 
     else:
         ts_result_makespans_stats = None
@@ -123,8 +108,8 @@ def output_benchmark_results(output_dir, ts_agent_list=None, ga_agent=None, titl
         ga_initial_makespans = [sol.makespan for sol in ga_agent.initial_population]
         ga_result_makespans = [sol.makespan for sol in ga_agent.result_population]
 
-        ga_initial_makespans_stats = compute_stats(ga_initial_makespans)
-        ga_result_makespans_stats = compute_stats(ga_result_makespans)
+        ga_initial_makespans_stats = _compute_stats(ga_initial_makespans)
+        ga_result_makespans_stats = _compute_stats(ga_result_makespans)
 
     else:
         ga_initial_makespans_stats = None
@@ -138,7 +123,7 @@ def output_benchmark_results(output_dir, ts_agent_list=None, ga_agent=None, titl
         ts_initial_makespans_stats=ts_initial_makespans_stats,
         ts_result_makespans_stats=ts_result_makespans_stats,
         iterations_per_ts_agent_stats=ts_iterations_stats,
-        output_directory=output_dir.resolve(),
+        output_directory=output_dir,
         ga_agent=ga_agent,
         ga_initial_makespans_stats=ga_initial_makespans_stats,
         ga_result_makespans_stats=ga_result_makespans_stats,
@@ -149,7 +134,30 @@ def output_benchmark_results(output_dir, ts_agent_list=None, ga_agent=None, titl
         output_file.write(rendered_template)
 
     if auto_open:
-        webbrowser.open(f'file://{output_dir.resolve()}/index.html')
+        webbrowser.open(f'file://{output_dir}/index.html')
+
+
+def _compute_stats(lst):
+    """
+    Computes the rounded min, median, max, standard deviation, variance and mean of a list of numbers.
+
+    :type lst: [float]
+    :param lst: numbers to compute the statistics of
+
+    :rtype: dict
+    :returns: dictionary of the statistics
+    """
+    # convert once so every statistic is computed on the same ndarray
+    arr = np.asarray(lst, dtype=np.float64)
+    var = arr.var(ddof=1) if arr.size > 1 else 0.0
+    return {
+        'min': round(float(arr.min())),
+        'median': round(float(np.median(arr))),
+        'max': round(float(arr.max())),
+        'std': round(float(np.sqrt(var))),
+        'var': round(float(var)),
+        'mean': round(float(arr.mean()))
+    }
 
 
 def _create_ts_plots(ts_agent_list, output_directory):
@@ -171,21 +179,22 @@ def _create_ts_plots(ts_agent_list, output_directory):
     nh_sizes_traces, nh_sizes_layout, \
     tl_sizes_traces, tl_sizes_layout = _make_ts_traces(ts_agent_list)
 
-    # create plots
+    # create plots, they share one plotly.min.js in the output directory instead of each embedding it
     plot(dict(data=makespans_traces, layout=makespans_layout),
          filename=str(output_directory / 'ts_makespans.html'),
-         auto_open=False)
+         auto_open=False, include_plotlyjs='directory')
     plot(dict(data=nh_sizes_traces, layout=nh_sizes_layout),
          filename=str(output_directory / 'neighborhood_sizes.html'),
-         auto_open=False)
+         auto_open=False, include_plotlyjs='directory')
     plot(dict(data=tl_sizes_traces, layout=tl_sizes_layout),
          filename=str(output_directory / 'tabu_list_sizes.html'),
-         auto_open=False)
+         auto_open=False, include_plotlyjs='directory')
 
     # create schedule
     best_solution = min([ts_agent.best_solution for ts_agent in ts_agent_list])
     best_solution.create_schedule_xlsx_file(str(output_directory / 'ts_schedule'), continuous=True)
-    best_solution.create_gantt_chart_html_file(str(output_directory / 'ts_gantt_chart.html'), continuous=True)
+    best_solution.create_gantt_chart_html_file(str(output_directory / 'ts_gantt_chart.html'),
+                                               continuous=True, include_plotlyjs='directory')
 
 
 def _create_ga_plots(ga_agent, output_directory):
@@ -208,11 +217,12 @@ def _create_ga_plots(ga_agent, output_directory):
     # create plot
     plot(dict(data=makespans_traces, layout=makespans_layout),
          filename=str(output_directory / 'ga_makespans.html'),
-         auto_open=False)
+         auto_open=False, include_plotlyjs='directory')
 
     # create schedule
     ga_agent.best_solution.create_schedule_xlsx_file(str(output_directory / 'ga_schedule'), continuous=True)
-    ga_agent.best_solution.create_gantt_chart_html_file(str(output_directory / 'ga_gantt_chart.html'), continuous=True)
+    ga_agent.best_solution.create_gantt_chart_html_file(str(output_directory / 'ga_gantt_chart.html'),
+                                                        continuous=True, include_plotlyjs='directory')
 
 
 def _make_ts_traces(ts_agent_list):
@@ -226,22 +236,24 @@ def _make_ts_traces(ts_agent_list):
     :returns: list of traces and layouts
     """
     # create traces for plots
+    # an empty agent list gives an empty trace of best makespans
+    best_iterations, best_makespans = tuple(zip(*(ts_agent.min_makespan_coordinates for ts_agent in ts_agent_list))) \
+                                      or ((), ())
     makespans_traces = [
-        go.Scatter(x=[ts_agent.min_makespan_coordinates[0] for ts_agent in ts_agent_list],
-                   y=[ts_agent.min_makespan_coordinates[1] for ts_agent in ts_agent_list], mode='markers',
-                   name='best makespans')
+        go.Scatter(x=best_iterations, y=best_makespans, mode='markers', name='best makespans')
     ]
 
     nh_sizes_traces = []
     tl_sizes_traces = []
 
     for i, ts_agent in enumerate(ts_agent_list):
-        x_axis = list(range(ts_agent.benchmark_iterations))
-        makespans_traces.append(
-            go.Scatter(x=x_axis, y=ts_agent.seed_solution_makespan_v_iter, name=f'TS trace {i}'))
-        nh_sizes_traces.append(
-            go.Scatter(x=x_axis, y=ts_agent.neighborhood_size_v_iter, name=f'TS trace {i}'))
-        tl_sizes_traces.append(go.Scatter(x=x_axis, y=ts_agent.tabu_size_v_iter, name=f'TS trace {i}'))
+        # the x axis and name are shared by the agent's three traces
+        x_axis = np.arange(ts_agent.benchmark_iterations)
+        name = f'TS trace {i}'
+        # the iteration traces can have thousands of points, so they are rendered with WebGL
+        makespans_traces.append(go.Scattergl(x=x_axis, y=ts_agent.seed_solution_makespan_v_iter, name=name))
+        nh_sizes_traces.append(go.Scattergl(x=x_axis, y=ts_agent.neighborhood_size_v_iter, name=name))
+        tl_sizes_traces.append(go.Scattergl(x=x_axis, y=ts_agent.tabu_size_v_iter, name=name))
 
     # create layouts for plots
     makespans_layout = dict(title='Seed Solution Makespan vs Iteration',
@@ -268,14 +280,15 @@ def _make_ga_traces(ga_agent):
     :returns: tuple containing (trace, layout)
     """
     # create traces for plot
+    x_axis = np.arange(ga_agent.benchmark_iterations)
     makespans_traces = [
         go.Scatter(x=[ga_agent.min_makespan_coordinates[0]], y=[ga_agent.min_makespan_coordinates[1]],
                    mode='markers',
                    name='best makespan'),
-        go.Scatter(x=list(range(ga_agent.benchmark_iterations)), y=ga_agent.best_solution_makespan_v_iter,
-                   name='Best makespan trace'),
-        go.Scatter(x=list(range(ga_agent.benchmark_iterations)), y=ga_agent.avg_population_makespan_v_iter,
-                   name='Avg population makespan')
+        go.Scattergl(x=x_axis, y=ga_agent.best_solution_makespan_v_iter,
+                     name='Best makespan trace'),
+        go.Scattergl(x=x_axis, y=ga_agent.avg_population_makespan_v_iter,
+                     name='Avg population makespan')
     ]
 
     # create layouts for plot
@@ -1,10 +1,26 @@
 import csv
-import re
+import hashlib
+import io
+import os
+import tempfile
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'jssp'
+"default directory for caching parsed Data instances"
+
+_CACHE_VERSION = 1
+# process umask, read once at import time because os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+# ndarray attributes of Data that are saved in a cache file
+_CACHED_ARRAYS = ('sequence_dependency_matrix', 'job_task_index_matrix', 'usable_machines_bitmask',
+                  'task_processing_times_matrix', 'machine_speeds', 'edge_task', 'edge_machine', 'edge_runtime',
+                  'task_offsets', 'task_job_ids', 'task_ids', 'task_sequences', 'task_pieces')
+
 
 class Task:
     """
@@ -25,45 +41,54 @@ class Task:
     :type pieces: int
     :param pieces: number of pieces this Task has
     """
+    __slots__ = ('job_id', 'task_id', 'sequence', 'usable_machines', 'pieces', '_hash')
+
     def __init__(self, job_id, task_id, sequence, usable_machines, pieces):
         """
         Initializes an instance of Task.
 
         See help(_Task)
         """
-        self._job_id = job_id
-        self._task_id = task_id
-        self._sequence = sequence
-        self._usable_machines = usable_machines
-        self._pieces = pieces
+        self.job_id = job_id
+        self.task_id = task_id
+        self.sequence = sequence
+        self.usable_machines = usable_machines
+        self.pieces = pieces
+        # note pieces are omitted, see __eq__
+        # only ints are hashed so the hash is the same in every process, it is pickled with the other slots
+        self._hash = hash((job_id, task_id, sequence, tuple(np.asarray(usable_machines, dtype=np.intc).tolist())))
 
     def get_job_id(self):
-        return self._job_id
+        return self.job_id
 
     def get_task_id(self):
-        return self._task_id
+        return self.task_id
 
     def get_sequence(self):
-        return self._sequence
+        return self.sequence
 
     def get_usable_machines(self):
-        return self._usable_machines
+        return self.usable_machines
 
     def get_pieces(self):
-        return self._pieces
+        return self.pieces
+
+    def __hash__(self):
+        return self._hash
 
     def __eq__(self, other):
-        return self._job_id == other.get_job_id() \
-               and self._task_id == other.get_task_id() \
-               and self._sequence == other.get_sequence() \
-               and np.array_equal(self._usable_machines, other.get_usable_machines())  # note pieces are omitted
+        return self._hash == other._hash \
+               and self.job_id == other.job_id \
+               and self.task_id == other.task_id \
+               and self.sequence == other.sequence \
+               and np.array_equal(self.usable_machines, other.usable_machines)  # note pieces are omitted
 
     def __str__(self):
-        return f"[{self._job_id}, " \
-            f"{self._task_id}, " \
-            f"{self._sequence}, " \
-            f"{self._usable_machines}, " \
-            f"{self._pieces}]"
+        return f"[{self.job_id}, " \
+            f"{self.task_id}, " \
+            f"{self.sequence}, " \
+            f"{self.usable_machines}, " \
+            f"{self.pieces}]"
 
 
 class Job:
@@ -73,21 +98,23 @@ class Job:
     :type job_id: int
     :param job_id: job ID of this Job
     """
+    __slots__ = ('job_id', 'max_sequence', '_tasks')
+
     def __init__(self, job_id):
         """
         Initializes an instance of Job.
 
         See help(_Job)
         """
-        self._job_id = job_id
+        self.job_id = job_id
+        self.max_sequence = 0
         self._tasks = []
-        self._max_sequence = 0
 
     def set_max_sequence(self, max_sequence):
-        self._max_sequence = max_sequence
+        self.max_sequence = max_sequence
 
     def get_max_sequence(self):
-        return self._max_sequence
+        return self.max_sequence
 
     def get_tasks(self):
         return self._tasks
@@ -96,14 +123,20 @@ class Job:
         return self._tasks[task_id]
 
     def get_job_id(self):
-        return self._job_id
+        return self.job_id
 
     def get_number_of_tasks(self):
         return len(self._tasks)
 
+    def __hash__(self):
+        # not cached because tasks are appended to the Job after it is created
+        return hash((self.job_id, self.max_sequence) + tuple(task._hash for task in self._tasks))
+
     def __eq__(self, other):
-        return self._job_id == other.get_job_id() \
-               and self._max_sequence == other.get_max_sequence() \
+        return self.job_id == other.job_id \
+               and self.max_sequence == other.max_sequence \
+               and len(self._tasks) == other.get_number_of_tasks() \
+               and all(task._hash == other_task._hash for task, other_task in zip(self._tasks, other.get_tasks())) \
                and self._tasks == other.get_tasks()
 
 
@@ -120,23 +153,232 @@ class Data(ABC):
         self.job_task_index_matrix = None
         "2d nparray of (job, task): index mapping"
 
-        self.usable_machines_matrix = None
-        "2d nparray of usable machines"
+        self.usable_machines_bitmask = None
+        "2d nparray of packed usable machines, bit m % 64 of word m // 64 is set if machine m is usable for a task"
+
+        self._usable_machines_matrix = None
 
         self.task_processing_times_matrix = None
-        "2d nparray of task processing times on machines"
+        "2d nparray of task processing times on machines, inf if the machine is not usable for the task"
 
         self.machine_speeds = None
         "1d nparray of machine speeds"
 
+        self.edge_task = None
+        "1d nparray of the task index of each (task, usable machine) edge, sorted by task index then machine"
+
+        self.edge_machine = None
+        "1d nparray of the usable machine of each (task, usable machine) edge"
+
+        self.edge_runtime = None
+        "1d nparray of the processing time of each (task, usable machine) edge"
+
+        self.task_offsets = None
+        "1d nparray of edge offsets, the edges of task t are edge_task[task_offsets[t]:task_offsets[t + 1]]"
+
         self.jobs = []
-        "list of all Job instances"
+        "tuple of all Job instances, indexed by job id"
+
+        self.task_job_ids = None
+        "1d nparray of each task's job id, indexed by task index"
+
+        self.task_ids = None
+        "1d nparray of each task's task id, indexed by task index"
+
+        self.task_sequences = None
+        "1d nparray of each task's sequence number, indexed by task index"
+
+        self.task_pieces = None
+        "1d nparray of each task's number of pieces, indexed by task index"
 
         self.total_number_of_jobs = 0
         self.total_number_of_tasks = 0
         self.total_number_of_machines = 0
         self.max_tasks_for_a_job = 0
 
+    @property
+    def usable_machines_matrix(self):
+        """
+        2d nparray of usable machines, where row i lists the usable machines of task i repeated to fill all of the columns.
+
+        The matrix is built from usable_machines_bitmask the first time it is accessed.
+        """
+        if self._usable_machines_matrix is None and self.usable_machines_bitmask is not None:
+            machines = np.arange(self.total_number_of_machines)
+            usable = ((self.usable_machines_bitmask[:, machines // 64] >> (machines % 64).astype(np.uint64))
+                      & np.uint64(1)).astype(bool)
+
+            # order each row so the usable machines come first, then repeat them across the row
+            order = np.argsort(~usable, axis=1, kind='stable')
+            num_usable_machines = np.maximum(usable.sum(axis=1), 1)
+            self._usable_machines_matrix = np.ascontiguousarray(
+                np.take_along_axis(order, machines % num_usable_machines[:, None], axis=1), dtype=np.intc)
+
+        return self._usable_machines_matrix
+
+    def is_machine_usable(self, task_index, machine):
+        """
+        Checks if a machine can process the task with index = task_index.
+
+        :type task_index: int
+        :param task_index: index of the task (see job_task_index_matrix)
+
+        :type machine: int
+        :param machine: id of machine
+
+        :rtype: bool
+        :returns: true if the machine is usable for the task
+        """
+        return bool((self.usable_machines_bitmask[task_index, machine // 64] >> np.uint64(machine % 64)) & np.uint64(1))
+
+    def tasks_can_use(self, task_indices, machines):
+        """
+        Checks if each machine in machines can process the task with the same position in task_indices.
+
+        :type task_indices: 1d nparray
+        :param task_indices: indices of the tasks (see job_task_index_matrix)
+
+        :type machines: 1d nparray
+        :param machines: ids of the machines
+
+        :rtype: 1d nparray
+        :returns: boolean array that is true where the machine is usable for the task
+        """
+        machines = np.asarray(machines)
+        return ((self.usable_machines_bitmask[task_indices, machines // 64] >> (machines % 64).astype(np.uint64))
+                & np.uint64(1)).astype(bool)
+
+    def _create_task_arrays(self):
+        """
+        Populates the per task arrays (task_job_ids, task_ids, task_sequences, task_pieces) from self.jobs.
+
+        :returns: None
+        """
+        tasks = [task for job in self.jobs for task in job.get_tasks()]
+        self.task_job_ids = np.fromiter((task.job_id for task in tasks), dtype=np.intc, count=len(tasks))
+        self.task_ids = np.fromiter((task.task_id for task in tasks), dtype=np.intc, count=len(tasks))
+        self.task_sequences = np.fromiter((task.sequence for task in tasks), dtype=np.intc, count=len(tasks))
+        self.task_pieces = np.fromiter((task.pieces for task in tasks), dtype=np.intc, count=len(tasks))
+
+    def _create_usable_machines_bitmask(self, task_indices, machine_indices):
+        """
+        Populates self.usable_machines_bitmask from (task index, usable machine) pairs.
+
+        :type task_indices: 1d nparray
+        :param task_indices: task index of each pair
+
+        :type machine_indices: 1d nparray
+        :param machine_indices: usable machine of each pair
+
+        :returns: None
+        """
+        self.usable_machines_bitmask = np.zeros((self.total_number_of_tasks, (self.total_number_of_machines + 63) // 64),
+                                                dtype=np.uint64)
+        np.bitwise_or.at(self.usable_machines_bitmask,
+                         (task_indices, machine_indices // 64),
+                         np.left_shift(np.uint64(1), (machine_indices % 64).astype(np.uint64)))
+        self._usable_machines_matrix = None
+
+    def _create_edge_list(self, task_indices, machine_indices):
+        """
+        Populates the CSR style edge list (edge_task, edge_machine, edge_runtime, task_offsets)
+        from (task index, usable machine) pairs.
+
+        Note self.task_processing_times_matrix must be populated before calling this function.
+
+        :type task_indices: 1d nparray
+        :param task_indices: task index of each pair
+
+        :type machine_indices: 1d nparray
+        :param machine_indices: usable machine of each pair
+
+        :returns: None
+        """
+        # sort the pairs by (task index, machine) and drop duplicates
+        edges = np.unique(np.asarray(task_indices, dtype=np.int64) * self.total_number_of_machines + machine_indices)
+        self.edge_task = (edges // self.total_number_of_machines).astype(np.intc)
+        self.edge_machine = (edges % self.total_number_of_machines).astype(np.intc)
+        self.edge_runtime = self.task_processing_times_matrix[self.edge_task, self.edge_machine]
+        self.task_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(self.edge_task, minlength=self.total_number_of_tasks)))).astype(np.intc)
+
+    def get_usable_machines(self, task_index):
+        """
+        Gets the usable machines of the task with index = task_index.
+
+        :type task_index: int
+        :param task_index: index of the task (see job_task_index_matrix)
+
+        :rtype: 1d nparray
+        :returns: sorted usable machines of the task
+        """
+        return self.edge_machine[self.task_offsets[task_index]:self.task_offsets[task_index + 1]]
+
+    def save_cache(self, path):
+        """
+        Saves all of the parsed data to a .npz cache file so that it can be reloaded with load_cache.
+
+        :type path: Path | str
+        :param path: path to the .npz file to save the data in
+
+        :returns: None
+        """
+        path = Path(path)
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
+
+        usable_machines = [np.asarray(task.usable_machines, dtype=np.intc) for job in self.jobs for task in
+                           job.get_tasks()]
+        arrays = {name: getattr(self, name) for name in _CACHED_ARRAYS if getattr(self, name) is not None}
+
+        # write to a temporary file first so other processes never load a partially written cache file
+        _replace_file(path, lambda fout: np.savez(
+            fout,
+            task_usable_machines=np.concatenate(usable_machines),
+            task_num_usable_machines=np.array([len(machines) for machines in usable_machines], dtype=np.intc),
+            total_number_of_machines=np.array(self.total_number_of_machines),
+            **arrays))
+
+    def load_cache(self, path):
+        """
+        Populates all of the data from a .npz cache file created by save_cache.
+
+        :type path: Path | str
+        :param path: path to the .npz file to load the data from
+
+        :returns: None
+        """
+        with np.load(path) as cache:
+            for name in _CACHED_ARRAYS:
+                if name in cache.files:
+                    setattr(self, name, cache[name])
+
+            usable_machines = np.split(cache['task_usable_machines'],
+                                       np.cumsum(cache['task_num_usable_machines'])[:-1])
+            self.total_number_of_machines = int(cache['total_number_of_machines'])
+
+        # read-only like a parsed or memory mapped sequence dependency matrix
+        self.sequence_dependency_matrix.flags.writeable = False
+        self._usable_machines_matrix = None
+
+        # rebuild the Job and Task instances from the per task arrays
+        self.jobs = []
+        for job_id, task_id, sequence, machines, pieces in zip(self.task_job_ids.tolist(), self.task_ids.tolist(),
+                                                               self.task_sequences.tolist(), usable_machines,
+                                                               self.task_pieces.tolist()):
+            if job_id == len(self.jobs):
+                self.jobs.append(Job(job_id))
+
+            job = self.jobs[job_id]
+            job.get_tasks().append(Task(job_id, task_id, sequence, machines, pieces))
+            if sequence > job.max_sequence:
+                job.set_max_sequence(sequence)
+
+        self.total_number_of_jobs = len(self.jobs)
+        self.total_number_of_tasks = len(self.task_ids)
+        self.max_tasks_for_a_job = self.job_task_index_matrix.shape[1]
+        self.jobs = tuple(self.jobs)
+
     def get_setup_time(self, job1_id, job1_task_id, job2_id, job2_task_id):
         """
         Gets the setup time for scheduling (job2_id, job2_task_id) after (job1_id, job1_task_id).
@@ -156,7 +398,8 @@ class Data(ABC):
         :rtype: int
         :return: setup time in minutes
         """
-        if min(job1_id, job1_task_id, job2_id, job2_task_id) < 0:
+        # the bitwise or of the ids is negative if any of them is -1
+        if (job1_id | job1_task_id | job2_id | job2_task_id) < 0:
             return 0
 
         return self.sequence_dependency_matrix[
@@ -231,14 +474,14 @@ class Data(ABC):
     @staticmethod
     def convert_fjs_to_csv(fjs_file, output_dir):
         """
-        Converts a fjs file into three csv files, jobTasks.csv, machineRunSpeed.csv, and sequenceDependencyMatrix.csv,
+        Converts a fjs file into jobTasks.csv, machineRunSpeed.csv, and sequenceDependencyMatrix.npy,
         then it puts them in the output directory.
 
         :type fjs_file: Path | str
         :param fjs_file: path to the fjs file containing a flexible job shop schedule problem instance
 
         :type output_dir: Path | str
-        :param output_dir: path to the directory to place the csv files into
+        :param output_dir: path to the directory to place the converted files into
 
         :returns: None
         """
@@ -251,39 +494,31 @@ class Data(ABC):
             output_dir.mkdir(parents=True)
 
         # read .fjs input file and create jobTasks.csv
-        with open(fjs_file, 'r') as fin:
-            with open(output_dir / 'jobTasks.csv', 'w') as fout:
-                fout.write("Job,Task,Sequence,Usable_Machines,Pieces\n")
-
-                lines = [line for line in [l.strip() for l in fin] if line]
-                line = [int(s) for s in re.sub(r'\s+', ' ', lines[0].strip()).split(' ')[:-1]]
-
-                total_num_machines = line[1]
+        _, total_num_machines, job_data = _read_fjs_file(fjs_file)
+        output = io.StringIO()
+        output.write("Job,Task,Sequence,Usable_Machines,Pieces\n")
 
-                # iterate over jobs
-                for job_id, tasks in enumerate(lines[1:]):
+        # iterate over jobs
+        i = 0
+        job_id = 0
+        while i < len(job_data):
+            num_tasks = job_data[i]
+            total_num_tasks += num_tasks
+            i += 1
 
-                    # get the tasks data
-                    task_data = [int(s) for s in re.sub(r'\s+', ' ', tasks.strip()).split(' ')]
-                    total_num_tasks += task_data[0]
-                    task_id = 0
-                    sequence = 0
+            # iterate over tasks
+            for task_id in range(num_tasks):
+                num_usable_machines = job_data[i]
+                usable_machines = ' '.join([str(machine - 1) for machine in
+                                            job_data[i + 1:i + num_usable_machines * 2 + 1:2]])
 
-                    # iterate over tasks
-                    i = 1
-                    while i < len(task_data):
-                        usable_machines = "["
-                        output_line = f"{job_id},{task_id},{sequence},"
-                        num_usable_machines = task_data[i]
+                output.write(f"{job_id},{task_id},{task_id},[{usable_machines}],{job_data[i + 2]}\n")
+                i += num_usable_machines * 2 + 1
 
-                        for j in range(i + 1, i + num_usable_machines * 2 + 1, 2):
-                            usable_machines += f"{task_data[j] - 1} "
+            job_id += 1
 
-                        output_line += usable_machines[:-1] + "]," + str(task_data[i + 2])
-                        i += num_usable_machines * 2 + 1
-                        task_id += 1
-                        sequence += 1
-                        fout.write(output_line + '\n')
+        with open(output_dir / 'jobTasks.csv', 'w') as fout:
+            fout.write(output.getvalue())
 
         # create machineRunSpeed.csv
         with open(output_dir / 'machineRunSpeed.csv', 'w') as fout:
@@ -291,11 +526,8 @@ class Data(ABC):
             for i in range(total_num_machines):
                 fout.write(f"{i},1\n")
 
-        # create sequenceDependencyMatrix.csv
-        with open(output_dir / 'sequenceDependencyMatrix.csv', 'w') as fout:
-            line = "0," * total_num_tasks + "0\n"
-            for _ in range(total_num_tasks + 1):
-                fout.write(line)
+        # create sequenceDependencyMatrix.npy (fjs instances have no setup times)
+        np.save(output_dir / 'sequenceDependencyMatrix.npy', np.zeros((total_num_tasks, total_num_tasks), dtype=np.intc))
 
 
 class CSVData(Data):
@@ -303,7 +535,7 @@ class CSVData(Data):
     JSSP instance data class for .csv data.
 
     :type seq_dep_matrix_file: Path | str
-    :param seq_dep_matrix_file: path to the csv file containing the sequence dependency setup times
+    :param seq_dep_matrix_file: path to the csv (or .npy) file containing the sequence dependency setup times
 
     :type machine_speeds_file: Path | str
     :param machine_speeds_file: path to the csv file containing all of the machine speeds
@@ -311,15 +543,18 @@ class CSVData(Data):
     :type job_tasks_file: Path | str
     :param job_tasks_file: path to the csv file containing all of the job-tasks
 
+    :type cache_dir: Path | str
+    :param cache_dir: directory to cache the parsed data in (e.g. DEFAULT_CACHE_DIR), the data is not cached if None
+
     :returns: None
     """
 
-    def __init__(self, seq_dep_matrix_file, machine_speeds_file, job_tasks_file):
+    def __init__(self, seq_dep_matrix_file, machine_speeds_file, job_tasks_file, cache_dir=None):
         """
         Initializes all of the static data from the csv files.
 
         :type seq_dep_matrix_file: Path | str
-        :param seq_dep_matrix_file: path to the csv file containing the sequence dependency setup times
+        :param seq_dep_matrix_file: path to the csv (or .npy) file containing the sequence dependency setup times
 
         :type machine_speeds_file: Path | str
         :param machine_speeds_file: path to the csv file containing all of the machine speeds
@@ -327,6 +562,9 @@ class CSVData(Data):
         :type job_tasks_file: Path | str
         :param job_tasks_file: path to the csv file containing all of the job-tasks
 
+        :type cache_dir: Path | str
+        :param cache_dir: directory to cache the parsed data in (e.g. DEFAULT_CACHE_DIR), the data is not cached if None
+
         :returns: None
         """
         super().__init__()
@@ -334,9 +572,21 @@ class CSVData(Data):
         self.seq_dep_matrix_file_path = Path(seq_dep_matrix_file)
         self.machine_speeds_file_path = Path(machine_speeds_file)
 
-        self._read_job_tasks_file(self.job_tasks_file_path)
-        self._read_sequence_dependency_matrix_file(self.seq_dep_matrix_file_path)
-        self._read_machine_speeds_file(self.machine_speeds_file_path)
+        if cache_dir is not None:
+            cache_file = _get_cache_file(cache_dir, [self.job_tasks_file_path, self.seq_dep_matrix_file_path,
+                                                     self.machine_speeds_file_path])
+            if cache_file.exists():
+                self.load_cache(cache_file)
+                return
+
+        # the files are independent, so read them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self._read_job_tasks_file, self.job_tasks_file_path),
+                       executor.submit(self._read_sequence_dependency_matrix_file, self.seq_dep_matrix_file_path),
+                       executor.submit(self._read_machine_speeds_file, self.machine_speeds_file_path)]
+            for future in futures:
+                future.result()
+        self._create_task_arrays()
 
         self.total_number_of_jobs = len(self.jobs)
         self.total_number_of_tasks = self.sequence_dependency_matrix.shape[0]
@@ -344,27 +594,30 @@ class CSVData(Data):
         self.total_number_of_machines = self.machine_speeds.shape[0]
 
         self.job_task_index_matrix = np.full((self.total_number_of_jobs, self.max_tasks_for_a_job), -1, dtype=np.intc)
-        self.usable_machines_matrix = np.empty((self.total_number_of_tasks, self.total_number_of_machines), dtype=np.intc)
-        self.task_processing_times_matrix = np.full((self.total_number_of_tasks, self.total_number_of_machines), -1, dtype=np.float)
-
-        # process all job-tasks
-        task_index = 0
-        for job in self.jobs:
-            for task in job.get_tasks():
-
-                # create mapping of (job id, task id) to index
-                self.job_task_index_matrix[job.get_job_id(), task.get_task_id()] = task_index
-
-                # create row in usable_machines_matrix
-                self.usable_machines_matrix[task_index] = np.resize(task.get_usable_machines(),
-                                                                    self.total_number_of_machines)
-
-                # create row in task_processing_times
-                for machine in task.get_usable_machines():
-                    self.task_processing_times_matrix[task_index, machine] = task.get_pieces() / self.machine_speeds[
-                        machine]
-
-                task_index += 1
+        self.task_processing_times_matrix = np.full((self.total_number_of_tasks, self.total_number_of_machines), np.inf,
+                                                    dtype=np.float32)
+
+        # create mapping of (job id, task id) to index
+        self.job_task_index_matrix[self.task_job_ids, self.task_ids] = np.arange(len(self.task_ids), dtype=np.intc)
+
+        # one (task index, machine) pair per usable machine
+        usable_machines = [task.usable_machines for job in self.jobs for task in job.get_tasks()]
+        num_usable_machines = np.array([len(machines) for machines in usable_machines], dtype=np.intc)
+        task_indices = np.repeat(np.arange(len(usable_machines)), num_usable_machines)
+        machine_indices = np.concatenate(usable_machines).astype(np.intc)
+
+        # create usable machines bitmask & rows in task_processing_times,
+        # the reciprocal speeds are kept in double precision so the products round to the same float32 run times
+        # as pieces / speed
+        inv_machine_speeds = 1.0 / self.machine_speeds.astype(np.float64)
+        self._create_usable_machines_bitmask(task_indices, machine_indices)
+        self.task_processing_times_matrix[task_indices, machine_indices] = \
+            self.task_pieces[task_indices] * inv_machine_speeds[machine_indices]
+        self._create_edge_list(task_indices, machine_indices)
+        self.jobs = tuple(self.jobs)
+
+        if cache_dir is not None:
+            self.save_cache(cache_file)
 
     def _read_job_tasks_file(self, job_tasks_file):
         """
@@ -378,50 +631,102 @@ class CSVData(Data):
         .. Note:: this function assumes that all of the jobs in job_tasks_file are in ascending order
         and are in the same order as in the sequence_dependency_matrix csv file.
         """
-        prev_job_id = -1  # record previously seen job_id
         with open(job_tasks_file) as fin:
             # skip headers (i.e. first row in csv file)
             next(fin)
-            for row in csv.reader(fin):
-                # create task object
-                task = Task(
-                    int(row[0]),  # job_id
-                    int(row[1]),  # task_id
-                    int(row[2]),  # seq num
-                    np.array([int(x) for x in row[3][1:-1].strip().split(' ')], dtype=np.intc),  # usable machines
-                    int(row[4])  # pieces
-                )
-                # create & append new job if we encounter job_id that has not been seen
-                if task.get_job_id() != prev_job_id:
-                    self.jobs.append(Job(task.get_job_id()))
-                    prev_job_id = task.get_job_id()
-
-                # update job's max sequence number
-                if task.get_sequence() > self.jobs[task.get_job_id()].get_max_sequence():
-                    self.jobs[task.get_job_id()].set_max_sequence(task.get_sequence())
-
-                # append task to associated job.tasks list
-                self.jobs[task.get_job_id()].get_tasks().append(task)
+            tasks = [Task(
+                int(row[0]),  # job_id
+                int(row[1]),  # task_id
+                int(row[2]),  # seq num
+                np.fromstring(row[3][1:-1], dtype=np.intc, sep=' '),  # usable machines
+                int(row[4])  # pieces
+            ) for row in csv.reader(fin)]
+
+        job_ids = np.fromiter((task.job_id for task in tasks), dtype=np.intc, count=len(tasks))
+        sequences = np.fromiter((task.sequence for task in tasks), dtype=np.intc, count=len(tasks))
+
+        # tasks are in ascending order of job id, so each job's tasks are a contiguous slice of tasks
+        job_starts = np.concatenate(([0], np.flatnonzero(np.diff(job_ids)) + 1))
+        job_ends = np.append(job_starts[1:], len(tasks))
+        max_sequences = np.maximum(np.maximum.reduceat(sequences, job_starts), 0)
+
+        for start, end, max_sequence in zip(job_starts.tolist(), job_ends.tolist(), max_sequences.tolist()):
+            job = Job(tasks[start].job_id)
+            job.get_tasks().extend(tasks[start:end])
+            job.set_max_sequence(max_sequence)
+            self.jobs.append(job)
 
     def _read_sequence_dependency_matrix_file(self, seq_dep_matrix_file):
         """
-        Populates self.sequence_dependency_matrix by reading the seq_dep_matrix_file csv file.
+        Populates self.sequence_dependency_matrix by reading the seq_dep_matrix_file csv file,
+        or by memory mapping it if it is a .npy file.
+        A .npy file that is not a C-contiguous 2d numpy.intc array is converted to one instead of being memory mapped.
+
+        A parsed csv file is saved as a .npy file next to it, together with a .npy.stamp file
+        that records the size and modification time of the csv file and the .npy file.
+        The .npy file is memory mapped instead of parsing the csv file again as long as the stamp matches both files.
 
         :type seq_dep_matrix_file: Path | str
-        :param seq_dep_matrix_file: path to the csv file that contains the sequence dependency matrix
+        :param seq_dep_matrix_file: path to the csv or .npy file that contains the sequence dependency matrix
 
         :returns: None
+        :raise: ValueError if the .npy file is not a 2d matrix of integers that fit in numpy.intc
 
         .. Note:: this function assumes that all of the jobs in job_tasks_file are in ascending order
         and are in the same order as in the sequence_dependency_matrix csv file.
 
         """
+        seq_dep_matrix_file = Path(seq_dep_matrix_file)
+        if seq_dep_matrix_file.suffix == '.npy':
+            sequence_dependency_matrix = np.load(seq_dep_matrix_file, mmap_mode='r')
+            if sequence_dependency_matrix.ndim != 2 or not np.issubdtype(sequence_dependency_matrix.dtype, np.integer):
+                raise ValueError(f"{seq_dep_matrix_file} must contain a 2d matrix of integers (numpy.intc), "
+                                 f"got a {sequence_dependency_matrix.ndim}d matrix of {sequence_dependency_matrix.dtype}")
+
+            # the makespan kernel needs a C-contiguous numpy.intc matrix (e.g. numpy.save writes int64 by default)
+            if sequence_dependency_matrix.dtype != np.intc or not sequence_dependency_matrix.flags.c_contiguous:
+                converted_matrix = np.ascontiguousarray(sequence_dependency_matrix, dtype=np.intc)
+                if not np.array_equal(converted_matrix, sequence_dependency_matrix):
+                    raise ValueError(f"{seq_dep_matrix_file} contains values that do not fit in numpy.intc")
+                converted_matrix.flags.writeable = False
+                sequence_dependency_matrix = converted_matrix
+
+            self.sequence_dependency_matrix = sequence_dependency_matrix
+            return
+
+        npy_file = seq_dep_matrix_file.with_suffix('.npy')
+        stamp_file = npy_file.with_name(npy_file.name + '.stamp')
+        csv_stat = seq_dep_matrix_file.stat()
+        try:
+            npy_stat = npy_file.stat()
+            if stamp_file.read_text() == _get_npy_stamp(csv_stat, npy_stat):
+                sequence_dependency_matrix = np.load(npy_file, mmap_mode='r')
+                # make sure the .npy file was not replaced while it was being mapped
+                if _get_npy_stamp(csv_stat, npy_file.stat()) == _get_npy_stamp(csv_stat, npy_stat):
+                    self.sequence_dependency_matrix = sequence_dependency_matrix
+                    return
+        except (OSError, ValueError):
+            pass  # there is no usable .npy file, so the csv file is parsed
+
+        # count the columns in the headers (i.e. first row in csv file)
         with open(seq_dep_matrix_file) as fin:
-            # skip headers (i.e. first row in csv file)
-            next(fin)
-            self.sequence_dependency_matrix = np.array(
-                [[int(x) for x in row[1:]]
-                 for row in csv.reader(fin)], dtype=np.intc)
+            num_columns = len(next(csv.reader(fin)))
+
+        # skip the headers and the first column which labels the rows
+        self.sequence_dependency_matrix = np.loadtxt(seq_dep_matrix_file, dtype=np.intc, delimiter=',', skiprows=1,
+                                                     usecols=range(1, num_columns), ndmin=2)
+        self.sequence_dependency_matrix.flags.writeable = False
+
+        try:
+            # the stamp is removed first so the new .npy file is not trusted until its stamp is written,
+            # replacing the .npy file keeps the old file intact for the Data instances that still map it
+            if stamp_file.exists():
+                stamp_file.unlink()
+            _replace_file(npy_file, lambda fout: np.save(fout, self.sequence_dependency_matrix))
+            stamp = _get_npy_stamp(csv_stat, npy_file.stat())
+            _replace_file(stamp_file, lambda fout: fout.write(stamp.encode()))
+        except OSError:
+            pass  # the directory is not writable, so the csv file will be parsed again next time
 
     def _read_machine_speeds_file(self, machine_speeds_file):
         """
@@ -434,10 +739,9 @@ class CSVData(Data):
 
         .. Note:: this function assumes that the machines are listed in ascending order.
         """
-        with open(machine_speeds_file) as fin:
-            # skip headers (i.e. first row in csv file)
-            next(fin)
-            self.machine_speeds = np.array([int(row[1]) for row in csv.reader(fin)], dtype=np.float)
+        # skip headers (i.e. first row in csv file)
+        self.machine_speeds = np.loadtxt(machine_speeds_file, dtype=np.float32, delimiter=',', skiprows=1,
+                                         usecols=(1,), ndmin=1)
 
 
 class FJSData(Data):
@@ -447,81 +751,184 @@ class FJSData(Data):
     :type input_file: Path | str
     :param input_file: path to the fjs file to read the data from
 
+    :type cache_dir: Path | str
+    :param cache_dir: directory to cache the parsed data in (e.g. DEFAULT_CACHE_DIR), the data is not cached if None
+
     :returns: None
     """
 
-    def __init__(self, input_file):
+    def __init__(self, input_file, cache_dir=None):
         """
         Initializes all of the static data from a fjs file.
 
         :type input_file: Path | str
         :param input_file: path to the fjs file to read the data from
 
+        :type cache_dir: Path | str
+        :param cache_dir: directory to cache the parsed data in (e.g. DEFAULT_CACHE_DIR), the data is not cached if None
+
         :returns: None
         """
         super().__init__()
         self.fjs_file_path = Path(input_file)
+
+        if cache_dir is not None:
+            cache_file = _get_cache_file(cache_dir, [self.fjs_file_path])
+            if cache_file.exists():
+                self.load_cache(cache_file)
+                return
+
         # read .fjs input file
-        with open(self.fjs_file_path, 'r') as fin:
-
-            lines = [line for line in [l.strip() for l in fin] if line]  # read all non-blank lines
-            first_line = [int(s) for s in re.sub(r'\s+', ' ', lines[0].strip()).split(' ')[:-1]]
-
-            self.total_number_of_jobs = first_line[0]  # get total num jobs
-            self.total_number_of_machines = first_line[1]  # get total num machines
-
-            self.total_number_of_tasks = 0
-            self.max_tasks_for_a_job = 0
-            for line in lines[1:]:  # iterate over jobs
-                # convert row (task data) to list of integers
-                line = [int(s) for s in re.sub(r'\s+', ' ', line.strip()).split(' ')]
-
-                num_tasks = int(line[0])
-                self.total_number_of_tasks += num_tasks
-                self.max_tasks_for_a_job = max(num_tasks, self.max_tasks_for_a_job)
-
-            # initialize matrices
-            self.task_processing_times_matrix = np.full((self.total_number_of_tasks, self.total_number_of_machines), -1,
-                                                        dtype=np.float)
-            self.sequence_dependency_matrix = np.zeros((self.total_number_of_tasks, self.total_number_of_tasks),
-                                                       dtype=np.intc)
-            self.usable_machines_matrix = np.empty((self.total_number_of_tasks, self.total_number_of_machines),
+        self.total_number_of_jobs, self.total_number_of_machines, job_data = _read_fjs_file(self.fjs_file_path)
+
+        # walk the job data once, creating the Jobs & Tasks and collecting one (task index, machine, run time)
+        # triple per usable machine
+        task_index = 0
+        task_indices = []
+        machine_indices = []
+        runtimes = []
+        job_ids = []
+        task_ids = []
+        i = 0
+        while i < len(job_data):  # iterate over jobs
+            job_id = len(self.jobs)
+            job = Job(job_id)
+            self.jobs.append(job)
+
+            num_tasks = job_data[i]
+            i += 1
+            for task_id in range(num_tasks):  # iterate over tasks
+                num_usable_machines = job_data[i]
+                end = i + num_usable_machines * 2 + 1
+
+                # machines are zero indexed
+                usable_machines = [machine - 1 for machine in job_data[i + 1:end:2]]
+                machine_indices += usable_machines
+                runtimes += job_data[i + 2:end:2]
+                task_indices += [task_index] * num_usable_machines
+
+                # sequence numbers of fjs tasks are the same as their task ids
+                job.get_tasks().append(Task(job_id, task_id, task_id, usable_machines, -1))
+                job_ids.append(job_id)
+                task_ids.append(task_id)
+
+                task_index += 1
+                i = end
+
+            job.set_max_sequence(num_tasks - 1)
+
+        self.total_number_of_tasks = task_index
+        self.max_tasks_for_a_job = max([job.get_number_of_tasks() for job in self.jobs], default=0)
+
+        # initialize & fill matrices
+        task_indices = np.array(task_indices, dtype=np.intc)
+        machine_indices = np.array(machine_indices, dtype=np.intc)
+
+        self.task_processing_times_matrix = np.full((self.total_number_of_tasks, self.total_number_of_machines), np.inf,
+                                                    dtype=np.float32)
+        self.task_processing_times_matrix[task_indices, machine_indices] = runtimes
+        self.sequence_dependency_matrix = np.zeros((self.total_number_of_tasks, self.total_number_of_tasks),
                                                    dtype=np.intc)
-            self.job_task_index_matrix = np.full((self.total_number_of_jobs, self.max_tasks_for_a_job), -1,
-                                                 dtype=np.intc)
+        self.sequence_dependency_matrix.flags.writeable = False
+        self.job_task_index_matrix = np.full((self.total_number_of_jobs, self.max_tasks_for_a_job), -1,
+                                             dtype=np.intc)
+        self.job_task_index_matrix[job_ids, task_ids] = np.arange(self.total_number_of_tasks, dtype=np.intc)
 
-            task_index = 0
-            for job_id, task_data in enumerate(lines[1:]):  # iterate over jobs
+        self._create_usable_machines_bitmask(task_indices, machine_indices)
+        self._create_edge_list(task_indices, machine_indices)
+        self._create_task_arrays()
+        self.jobs = tuple(self.jobs)
 
-                # create and append new Job
-                self.jobs.append(Job(job_id))
+        if cache_dir is not None:
+            self.save_cache(cache_file)
 
-                task_id = 0
-                sequence = 0
 
-                # get all the Job's task data
-                task_data = [int(s) for s in re.sub(r'\s+', ' ', task_data.strip()).split(' ')]
+def _get_cache_file(cache_dir, input_files):
+    """
+    Gets the path of the cache file for a set of input files, which is keyed by a hash of the files' contents.
+
+    :type cache_dir: Path | str
+    :param cache_dir: directory that contains the cache files
+
+    :type input_files: [Path]
+    :param input_files: paths to the input files that the data is parsed from
+
+    :rtype: Path
+    :returns: path to the .npz cache file
+    """
+    digest = hashlib.md5(str(_CACHE_VERSION).encode())
+    for input_file in input_files:
+        with open(input_file, 'rb') as fin:
+            digest.update(fin.read())
+
+    return Path(cache_dir) / f'{digest.hexdigest()}.npz'
 
-                i = 1
-                while i < len(task_data):  # iterate over tasks
-                    num_usable_machines = task_data[i]
-                    usable_machines = []
 
-                    for j in range(i + 1, i + num_usable_machines * 2 + 1, 2):  # iterate over machines & run times for task
-                        machine = task_data[j] - 1  # machines are zero indexed
-                        runtime = task_data[j + 1]
+def _get_npy_stamp(csv_stat, npy_stat):
+    """
+    Gets the stamp of a .npy file that was saved from a csv file.
+
+    :type csv_stat: os.stat_result
+    :param csv_stat: stat of the csv file, taken before it was parsed
 
-                        usable_machines.append(machine)
-                        self.task_processing_times_matrix[task_index, machine] = runtime
+    :type npy_stat: os.stat_result
+    :param npy_stat: stat of the .npy file
+
+    :rtype: str
+    :returns: stamp of the sizes, modification times and the .npy file's inode
+    """
+    return f'{csv_stat.st_size} {csv_stat.st_mtime_ns} {npy_stat.st_size} {npy_stat.st_mtime_ns} {npy_stat.st_ino}'
+
+
+def _replace_file(path, write):
+    """
+    Writes a file to a temporary file in the same directory, then replaces path with it.
+
+    Readers never see a partially written file and memory maps of the old file keep the old contents.
+    The file gets the same permissions as a file created with open (tempfile.mkstemp creates it with 0600).
+
+    :type path: Path
+    :param path: path of the file to write
+
+    :type write: callable
+    :param write: function that writes the contents to the binary file object it is given
+
+    :returns: None
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fout:
+            write(fout)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _read_fjs_file(fjs_file):
+    """
+    Reads a fjs file in one pass.
+
+    The header line is read first, then the job lines are streamed from the file into numpy's text parser
+    which produces one flat list of integers,
+    where each job is its number of tasks followed by each task's number of usable machines and (machine, run time) pairs.
+
+    :type fjs_file: Path | str
+    :param fjs_file: path to the fjs file to read
+
+    :rtype: (int, int, [int])
+    :returns: total number of jobs, total number of machines, and flat list of the jobs' data
+    """
+    with open(fjs_file, 'r') as fin:
+        # skip any blank lines before the header
+        header = fin.readline()
+        while header and not header.strip():
+            header = fin.readline()
 
-                    self.jobs[job_id].get_tasks().append(Task(job_id, task_id, sequence, usable_machines, -1))
-                    self.usable_machines_matrix[task_index] = np.resize(np.array(usable_machines, dtype=np.intc),
-                                                                        self.total_number_of_machines)
-                    self.job_task_index_matrix[job_id, task_id] = task_index
+        job_data = np.fromfile(fin, dtype=np.intc, sep=' ')
 
-                    task_id += 1
-                    sequence += 1
-                    task_index += 1
-                    i += num_usable_machines * 2 + 1
+    # the last value of the header is the average number of machines per operation, which is not needed
+    header = [int(s) for s in header.split()[:-1]]
 
-                self.jobs[job_id].set_max_sequence(sequence - 1)
+    return header[0], header[1], job_data.tolist()
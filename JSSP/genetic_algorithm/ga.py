@@ -1,5 +1,4 @@
 import random
-import statistics
 import time
 from enum import Enum
 
@@ -189,7 +188,7 @@ class GeneticAlgorithmAgent:
         not_done = True
         while not stop_condition():
             if self.benchmark:
-                avg_population_makespan_v_iter.append(statistics.mean([sol.makespan for sol in population]))
+                avg_population_makespan_v_iter.append(sum(sol.makespan for sol in population) / len(population))
 
             next_population = []
             while len(population) > self.selection_size and not_done:
@@ -0,0 +1,4 @@
+cpdef double[::1] compute_machine_makespans(int[:, ::1] operation_2d_array,
+                                            const float[:, ::1] task_processing_times_matrix,
+                                            const int[:, ::1] sequence_dependency_matrix,
+                                            const int[:, ::1] job_task_index_matrix)
@@ -10,7 +10,7 @@ from libc.stdlib cimport abort, malloc, free
 @cython.nonecheck(False)
 @cython.cdivision(True)
 cpdef double[::1] compute_machine_makespans(int[:, ::1] operation_2d_array,
-                                            const double[:, ::1] task_processing_times_matrix,
+                                            const float[:, ::1] task_processing_times_matrix,
                                             const int[:, ::1] sequence_dependency_matrix,
                                             const int[:, ::1] job_task_index_matrix):
     """
@@ -39,11 +39,8 @@ cpdef double[::1] compute_machine_makespans(int[:, ::1] operation_2d_array,
     # memory for keeping track of all machine's make span time
     cdef double[::1] machine_makespan_memory = np.zeros(num_machines)
 
-    # memory for keeping track of all machine's latest job that was processed
-    cdef int * machine_jobs_memory = <int *> malloc(sizeof(int) * num_machines)
-
-    # memory for keeping track of all machine's latest task that was processed
-    cdef int * machine_tasks_memory = <int *> malloc(sizeof(int) * num_machines)
+    # memory for keeping track of the task index of all machine's latest task that was processed
+    cdef int * machine_task_index_memory = <int *> malloc(sizeof(int) * num_machines)
 
     # memory for keeping track of all job's latest task's sequence that was processed
     cdef int * job_seq_memory = <int *> malloc(sizeof(int) * num_jobs)
@@ -54,16 +51,17 @@ cpdef double[::1] compute_machine_makespans(int[:, ::1] operation_2d_array,
     # memory for keeping track of all job's latest end time that was processed
     cdef double * job_end_memory = <double *> malloc(sizeof(double) * num_jobs)
 
-    if machine_jobs_memory == NULL or machine_tasks_memory == NULL or job_seq_memory == NULL or job_end_memory == NULL:
+    if machine_task_index_memory == NULL or job_seq_memory == NULL \
+            or prev_job_end_memory == NULL or job_end_memory == NULL:
         abort()
 
     cdef Py_ssize_t row, i
-    cdef int job_id, task_id, sequence, machine, setup, cur_task_index, prev_task_index
-    cdef double wait
+    cdef int job_id, sequence, machine, setup, cur_task_index, prev_task_index
+    cdef double wait, runtime
+    cdef bint infeasible = False
 
     for i in range(num_machines):
-        machine_jobs_memory[i] = -1
-        machine_tasks_memory[i] = -1
+        machine_task_index_memory[i] = -1
 
     i = 0
     for i in range(num_jobs):
@@ -74,19 +72,19 @@ cpdef double[::1] compute_machine_makespans(int[:, ::1] operation_2d_array,
     for row in range(operation_2d_array.shape[0]):
 
         job_id = operation_2d_array[row, 0]
-        task_id = operation_2d_array[row, 1]
         sequence = operation_2d_array[row, 2]
         machine = operation_2d_array[row, 3]
+        cur_task_index = job_task_index_matrix[job_id, operation_2d_array[row, 1]]
 
-        if machine_jobs_memory[machine] != -1:
-            cur_task_index = job_task_index_matrix[job_id, task_id]
-            prev_task_index = job_task_index_matrix[machine_jobs_memory[machine], machine_tasks_memory[machine]]
+        prev_task_index = machine_task_index_memory[machine]
+        if prev_task_index != -1:
             setup = sequence_dependency_matrix[cur_task_index, prev_task_index]
         else:
             setup = 0
 
         if setup < 0 or sequence < job_seq_memory[job_id]:
-            raise InfeasibleSolutionException()
+            infeasible = True
+            break
 
         if job_seq_memory[job_id] < sequence:
             prev_job_end_memory[job_id] = job_end_memory[job_id]
@@ -96,20 +94,22 @@ cpdef double[::1] compute_machine_makespans(int[:, ::1] operation_2d_array,
         else:
             wait = prev_job_end_memory[job_id] - machine_makespan_memory[machine]
 
-        runtime = task_processing_times_matrix[job_task_index_matrix[job_id, task_id], machine]
+        runtime = task_processing_times_matrix[cur_task_index, machine]
 
         # compute total added time and update memory modules
         machine_makespan_memory[machine] += runtime + wait + setup
         job_end_memory[job_id] = max(machine_makespan_memory[machine], job_end_memory[job_id])
         job_seq_memory[job_id] = sequence
-        machine_jobs_memory[machine] = job_id
-        machine_tasks_memory[machine] = task_id
+        machine_task_index_memory[machine] = cur_task_index
 
     # free the memory modules
-    free(machine_jobs_memory)
-    free(machine_tasks_memory)
+    free(machine_task_index_memory)
     free(job_seq_memory)
     free(job_end_memory)
     free(prev_job_end_memory)
 
+    # raise after the memory modules are freed so infeasible solutions do not leak them
+    if infeasible:
+        raise InfeasibleSolutionException()
+
     return machine_makespan_memory
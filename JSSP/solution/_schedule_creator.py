@@ -138,7 +138,7 @@ def create_schedule_xlsx_file(solution, output_path, start_date=datetime.date.to
 
 def create_gantt_chart(solution, output_path, title='Gantt Chart', start_date=datetime.date.today(),
                        start_time=datetime.time(hour=8, minute=0), end_time=datetime.time(hour=20, minute=0),
-                       iplot_bool=False, auto_open=False, continuous=False):
+                       iplot_bool=False, auto_open=False, continuous=False, include_plotlyjs=True):
     """
     Creates a gantt chart html file of the solution parameters in the output_dir directory if iplot_bool is false,
     else it plots a gantt chart of the solution parameter in an ipyton notebook.
@@ -170,6 +170,9 @@ def create_gantt_chart(solution, output_path, title='Gantt Chart', start_date=da
     :type continuous: bool
     :param continuous: if true a continuous schedule is created. (i.e. start_time and end_time are not used)
 
+    :type include_plotlyjs: bool | str
+    :param include_plotlyjs: how plotly.js is included in the html file, see plotly.offline.plot
+
     :returns: None
     """
 
@@ -204,4 +207,4 @@ def create_gantt_chart(solution, output_path, title='Gantt Chart', start_date=da
     if iplot_bool:
         iplot(fig)
     else:
-        plot(fig, filename=str(output_path), auto_open=auto_open)
+        plot(fig, filename=str(output_path), auto_open=auto_open, include_plotlyjs=include_plotlyjs)
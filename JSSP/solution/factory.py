@@ -90,41 +90,41 @@ class SolutionFactory:
         """
         operation_list = []
         last_task_scheduled_on_machine = [None] * self.jssp_instance_data.total_number_of_machines
-        available = {job.get_job_id(): [task for task in job.get_tasks() if task.get_sequence() == 0] for job in
-                     self.jssp_instance_data.jobs}
+        jobs = self.jssp_instance_data.jobs
+        available = {job.job_id: [task for task in job.get_tasks() if task.sequence == 0] for job in jobs}
 
         while 0 < len(available):
             get_unstuck = 0
             rand_job_id = random.choice(list(available.keys()))
             rand_task = random.choice(available[rand_job_id])
-            rand_machine = np.random.choice(rand_task.get_usable_machines())
+            rand_machine = np.random.choice(rand_task.usable_machines)
 
             # this loop prevents scheduling a task on a machine with sequence # > last task scheduled - 1 if the tasks are apart of the same job.
             # Without this loop Infeasible solutions may be generated. The get_unstuck variable ensures that this loop doesn't run forever.
             if isinstance(self.jssp_instance_data, CSVData):
                 while last_task_scheduled_on_machine[rand_machine] is not None \
-                        and last_task_scheduled_on_machine[rand_machine].get_job_id() == rand_job_id \
-                        and last_task_scheduled_on_machine[rand_machine].get_sequence() + 1 < rand_task.get_sequence():
+                        and last_task_scheduled_on_machine[rand_machine].job_id == rand_job_id \
+                        and last_task_scheduled_on_machine[rand_machine].sequence + 1 < rand_task.sequence:
 
                     rand_job_id = random.choice(list(available.keys()))
                     rand_task = random.choice(available[rand_job_id])
-                    rand_machine = np.random.choice(rand_task.get_usable_machines())
+                    rand_machine = np.random.choice(rand_task.usable_machines)
                     get_unstuck += 1
                     if get_unstuck > 50:
                         return self.get_solution()  # TODO this is not the best way to do this...
 
             available[rand_job_id].remove(rand_task)
             if len(available[rand_job_id]) == 0:
-                if rand_task.get_sequence() == self.jssp_instance_data.get_job(rand_job_id).get_max_sequence():
+                if rand_task.sequence == jobs[rand_job_id].max_sequence:
                     # all of the tasks in the job have been scheduled
                     del available[rand_job_id]
                 else:
                     # add all the tasks in the same job with the next sequence number
-                    available[rand_job_id] = [t for t in self.jssp_instance_data.get_job(rand_job_id).get_tasks() if
-                                              t.get_sequence() == rand_task.get_sequence() + 1]
+                    available[rand_job_id] = [t for t in jobs[rand_job_id].get_tasks() if
+                                              t.sequence == rand_task.sequence + 1]
 
             last_task_scheduled_on_machine[rand_machine] = rand_task
-            operation_list.append([rand_job_id, rand_task.get_task_id(), rand_task.get_sequence(), rand_machine])
+            operation_list.append([rand_job_id, rand_task.task_id, rand_task.sequence, rand_machine])
 
         return Solution(self.jssp_instance_data, np.array(operation_list, dtype=np.intc))
 
@@ -137,13 +137,14 @@ class SolutionFactory:
         """
         operation_list = []
         last_task_scheduled_on_machine = [None] * self.jssp_instance_data.total_number_of_machines
+        jobs = self.jssp_instance_data.jobs
         available_heap = _JobTaskHeap(self.jssp_instance_data, maxheap=lpt)
 
         while 0 < len(available_heap):
             get_unstuck = 0
             rand_task = available_heap.pop_task()
-            rand_job_id = rand_task.get_job_id()
-            rand_machine = np.random.choice(rand_task.get_usable_machines())
+            rand_job_id = rand_task.job_id
+            rand_machine = np.random.choice(rand_task.usable_machines)
 
             # this loop prevents scheduling a task on a machine with sequence # > last task scheduled - 1 if the tasks are apart of the same job.
             # Without this loop Infeasible solutions may be generated. The get_unstuck variable ensures that this loop doesn't run forever.
@@ -152,15 +153,15 @@ class SolutionFactory:
             #  This shouldn't happen if the sequence dependency matrix is correct and accounts for wait time
             if isinstance(self.jssp_instance_data, CSVData):
                 while last_task_scheduled_on_machine[rand_machine] is not None \
-                        and last_task_scheduled_on_machine[rand_machine].get_job_id() == rand_job_id \
-                        and last_task_scheduled_on_machine[rand_machine].get_sequence() + 1 < rand_task.get_sequence():
+                        and last_task_scheduled_on_machine[rand_machine].job_id == rand_job_id \
+                        and last_task_scheduled_on_machine[rand_machine].sequence + 1 < rand_task.sequence:
 
                     # save the task that was removed but cannot be scheduled
                     tmp_task_list.append(rand_task)
 
                     rand_task = available_heap.pop_task()
-                    rand_job_id = rand_task.get_job_id()
-                    rand_machine = np.random.choice(rand_task.get_usable_machines())
+                    rand_job_id = rand_task.job_id
+                    rand_machine = np.random.choice(rand_task.usable_machines)
                     get_unstuck += 1
 
                     if get_unstuck > 50:
@@ -171,18 +172,18 @@ class SolutionFactory:
                 available_heap.push_task(task)
 
             if len(available_heap.dict[rand_job_id]) == 0:
-                if rand_task.get_sequence() == self.jssp_instance_data.get_job(rand_job_id).get_max_sequence():
+                if rand_task.sequence == jobs[rand_job_id].max_sequence:
                     # all of the tasks in the job have been scheduled
                     del available_heap.dict[rand_job_id]
                 else:
                     # add all the tasks in the same job with the next sequence number
-                    for t in self.jssp_instance_data.get_job(rand_job_id).get_tasks():
-                        if t.get_sequence() == rand_task.get_sequence() + 1:
+                    for t in jobs[rand_job_id].get_tasks():
+                        if t.sequence == rand_task.sequence + 1:
                             # available_heap.dict[rand_job_id].append(t)
                             available_heap.push_task(t)
 
             last_task_scheduled_on_machine[rand_machine] = rand_task
-            operation_list.append([rand_job_id, rand_task.get_task_id(), rand_task.get_sequence(), rand_machine])
+            operation_list.append([rand_job_id, rand_task.task_id, rand_task.sequence, rand_machine])
 
         return Solution(self.jssp_instance_data, np.array(operation_list, dtype=np.intc))
 
@@ -197,22 +198,22 @@ class _JobTaskHeap:
         self.data = data
         self.maxheap = maxheap
         self.heap = []
-        self.dict = {job.get_job_id(): [task for task in job.get_tasks() if task.get_sequence() == 0] for job in
+        self.dict = {job.job_id: [task for task in job.get_tasks() if task.sequence == 0] for job in
                      self.data.jobs}
         for job in self.data.jobs:
             for task in job.get_tasks():
-                if task.get_sequence() == 0:
+                if task.sequence == 0:
                     heapq.heappush(self.heap,
                                    _MaxHeapObj(self.data, task) if self.maxheap else _MinHeapObj(self.data, task))
 
     def push_task(self, task):
         heapq.heappush(self.heap,
                        _MaxHeapObj(self.data, task) if self.maxheap else _MinHeapObj(self.data, task))
-        self.dict[task.get_job_id()].append(task)
+        self.dict[task.job_id].append(task)
 
     def pop_task(self):
         task = heapq.heappop(self.heap).val
-        self.dict[task.get_job_id()].remove(task)
+        self.dict[task.job_id].remove(task)
         return task
 
     def __len__(self):
@@ -225,15 +226,15 @@ class _MaxHeapObj:
         self.val = val
 
     def _get_avg_processing_time(self, other):
-        self_index = self.data.job_task_index_matrix[self.val.get_job_id(), self.val.get_task_id()]
-        other_index = self.data.job_task_index_matrix[other.val.get_job_id(), other.val.get_task_id()]
+        self_index = self.data.job_task_index_matrix[self.val.job_id, self.val.task_id]
+        other_index = self.data.job_task_index_matrix[other.val.job_id, other.val.task_id]
         self_processing_times = [processing_time for processing_time in
                                  self.data.task_processing_times_matrix[self_index] if
-                                 processing_time != -1]
+                                 processing_time != np.inf]
         other_processing_times = [processing_time for processing_time in
                                   self.data.task_processing_times_matrix[other_index]
                                   if
-                                  processing_time != -1]
+                                  processing_time != np.inf]
         self_avg_processing_time = sum(self_processing_times) / len(self_processing_times)
         other_avg_processing_time = sum(other_processing_times) / len(other_processing_times)
         return other_avg_processing_time, self_avg_processing_time
@@ -37,14 +37,18 @@ class Solution:
 
     :type operation_2d_array: nparray
     :param operation_2d_array: 2d nparray of operations
+
+    :type machine_makespans: nparray
+    :param machine_makespans: machine makespan times of operation_2d_array if they were already computed
     """
 
-    def __init__(self, data, operation_2d_array):
+    def __init__(self, data, operation_2d_array, machine_makespans=None):
         """
         Initializes an instance of Solution.
 
         First it checks if the operation_2d_array parameter is feasible,
         then it computes the nparray of machine makespan times and the makespan time of the Solution.
+        If machine_makespans is given they are not computed again.
 
         :raise: InfeasibleSolutionException if solution is infeasible
         :raise: IncompleteSolutionException if solution is incomplete
@@ -55,10 +59,12 @@ class Solution:
             raise IncompleteSolutionException(f"Incomplete Solution of size {operation_2d_array.shape[0]}. "
                                               f"Should be {data.total_number_of_tasks}")
 
-        self.machine_makespans = compute_machine_makespans(operation_2d_array,
-                                                           data.task_processing_times_matrix,
-                                                           data.sequence_dependency_matrix,
-                                                           data.job_task_index_matrix)
+        if machine_makespans is None:
+            machine_makespans = compute_machine_makespans(operation_2d_array,
+                                                          data.task_processing_times_matrix,
+                                                          data.sequence_dependency_matrix,
+                                                          data.job_task_index_matrix)
+        self.machine_makespans = machine_makespans
         self.makespan = max(self.machine_makespans)
         self.operation_2d_array = operation_2d_array
         self.data = data
@@ -198,7 +204,8 @@ class Solution:
 
     def create_gantt_chart_html_file(self, output_path, title='Gantt Chart', start_date=datetime.date.today(),
                                      start_time=datetime.time(hour=8, minute=0),
-                                     end_time=datetime.time(hour=20, minute=0), auto_open=False, continuous=False):
+                                     end_time=datetime.time(hour=20, minute=0), auto_open=False, continuous=False,
+                                     include_plotlyjs=True):
         """
         Creates a gantt chart html file of the solution.
 
@@ -223,11 +230,14 @@ class Solution:
         :type continuous: bool
         :param continuous: if true a continuous schedule is created. (i.e. start_time and end_time are not used)
 
+        :type include_plotlyjs: bool | str
+        :param include_plotlyjs: how plotly.js is included in the html file, 'directory' shares one plotly.min.js next to it
+
         :returns: None
         """
         create_gantt_chart(self, output_path, title=title, start_date=start_date, start_time=start_time,
                            end_time=end_time, iplot_bool=False, auto_open=auto_open,
-                           continuous=continuous)
+                           continuous=continuous, include_plotlyjs=include_plotlyjs)
 
     def get_operation_list_for_machine(self, start_date=datetime.date.today(), start_time=datetime.time(hour=8),
                                        end_time=datetime.time(hour=20), continuous=False, machines=None):
@@ -255,6 +265,9 @@ class Solution:
         result = []
         num_jobs = self.data.total_number_of_jobs
         num_machines = self.data.total_number_of_machines
+        sequence_dependency_matrix = self.data.sequence_dependency_matrix
+        job_task_index_matrix = self.data.job_task_index_matrix
+        task_processing_times_matrix = self.data.task_processing_times_matrix
         start_datetime = datetime.datetime(year=start_date.year, month=start_date.month, day=start_date.day,
                                            hour=start_time.hour, minute=start_time.minute, second=start_time.second)
         machine_datetime_dict = {machine_id: start_datetime for machine_id in range(num_machines)}
@@ -262,8 +275,8 @@ class Solution:
         # memory for keeping track of all machine's make span times
         machine_makespan_memory = [0] * num_machines
 
-        # memory for keeping track of all machine's latest (job, task) that was processed
-        machine_jobs_memory = [(-1, -1)] * num_machines
+        # memory for keeping track of all machine's latest task index that was processed
+        machine_task_index_memory = [-1] * num_machines
 
         # memory for keeping track of all job's latest task's sequence that was processed
         job_seq_memory = [0] * num_jobs
@@ -281,7 +294,9 @@ class Solution:
             sequence = self.operation_2d_array[row, 2]
             machine = self.operation_2d_array[row, 3]
 
-            setup = self.data.get_setup_time(job_id, task_id, machine_jobs_memory[machine][0], machine_jobs_memory[machine][1])
+            task_index = job_task_index_matrix[job_id, task_id]
+            prev_task_index = machine_task_index_memory[machine]
+            setup = 0 if prev_task_index < 0 else sequence_dependency_matrix[task_index, prev_task_index]
 
             if job_seq_memory[job_id] < sequence:
                 prev_job_seq_end_memory[job_id] = job_end_memory[job_id]
@@ -291,7 +306,7 @@ class Solution:
             else:
                 wait = prev_job_seq_end_memory[job_id] - machine_makespan_memory[machine]
 
-            runtime = self.data.get_runtime(job_id, task_id, machine)
+            runtime = task_processing_times_matrix[task_index, machine]
 
             tmp_dt = machine_datetime_dict[machine] + datetime.timedelta(minutes=wait)
             if not continuous and (tmp_dt.time() > end_time or tmp_dt.day != machine_datetime_dict[machine].day):
@@ -323,6 +338,6 @@ class Solution:
             machine_makespan_memory[machine] += runtime + wait + setup
             job_end_memory[job_id] = max(machine_makespan_memory[machine], job_end_memory[job_id])
             job_seq_memory[job_id] = sequence
-            machine_jobs_memory[machine] = (job_id, task_id)
+            machine_task_index_memory[machine] = task_index
 
         return result
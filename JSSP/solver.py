@@ -1,33 +1,200 @@
+import contextlib
 import multiprocessing as mp
 import pickle
+import sys
+import threading
 import time
+import weakref
+from multiprocessing.pool import Pool
+from multiprocessing.queues import SimpleQueue
+from multiprocessing.reduction import ForkingPickler
 
+import numpy as np
 from progressbar import Bar, ETA, ProgressBar, RotatingMarker
 
 from . import benchmark_plotter
 from . import genetic_algorithm
 from . import tabu_search
+from .data import CSVData, FJSData
 from .solution import SolutionFactory, Solution
 
+# fork lets the worker processes inherit the loaded Data instead of receiving a copy of it
+_mp_context = mp.get_context('fork') if sys.platform.startswith('linux') else mp.get_context()
 
-def _run_progress_bar(seconds):
+# Data instances that the worker processes already have, keyed by the id of the Data instance in the parent process
+_shared_data = weakref.WeakValueDictionary()
+# maps the id of a shared Data instance in a spawned worker process to its key in _shared_data
+_shared_data_keys = {}
+# strong reference to the shared Data instance in a worker process
+_worker_data = None
+
+
+def _run_progress_bar(seconds, stop_event):
     """
-    Runs a progress bar for a certain duration.
+    Runs a progress bar for a certain duration or until stop_event is set.
 
-    :type seconds: int
+    :type seconds: float
     :param seconds: duration to run the process bar for in seconds
 
+    :type stop_event: threading.Event
+    :param stop_event: event that stops the progress bar when it is set
+
     :returns: None
     """
-    time.sleep(.5)
+    if stop_event.wait(.5):
+        return
     widgets = [Bar(marker=RotatingMarker()), ' ', ETA()]
     pbar = ProgressBar(widgets=widgets, maxval=seconds).start()
-    for i in range(seconds):
-        time.sleep(.98)
+
+    # wait until each whole second after the start so the updates do not drift
+    start_time = time.monotonic()
+    for i in range(1, int(seconds) + 1):
+        if stop_event.wait(max(0.0, start_time + i - time.monotonic())):
+            break
         pbar.update(i)
     pbar.finish()
 
 
+@contextlib.contextmanager
+def _progress_bar_thread(seconds, enabled):
+    """
+    Runs a progress bar in a daemon thread while the with block runs, it only sleeps and prints
+    so it does not need its own process.
+
+    The thread is stopped and joined when the with block exits,
+    so it is never running when the Solver's pool forks new worker processes.
+
+    :type seconds: float
+    :param seconds: duration to run the process bar for in seconds
+
+    :type enabled: bool
+    :param enabled: if false no progress bar is run
+
+    :returns: None
+    """
+    if not enabled:
+        yield
+        return
+
+    stop_event = threading.Event()
+    thread = threading.Thread(target=_run_progress_bar, args=[seconds, stop_event], name='progress bar',
+                              daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop_event.set()
+        thread.join()
+
+
+def _get_shared_data(key):
+    """
+    Gets a Data instance that was shared with the worker processes.
+
+    :type key: int
+    :param key: key of the Data instance in _shared_data
+
+    :rtype: Data
+    :returns: the shared Data instance
+    """
+    return _shared_data[key]
+
+
+def _reduce_data(data):
+    """
+    Pickles a Data instance that is sent between the parent and the worker processes of a Solver's pool.
+
+    Data instances that the worker processes already have are pickled as a reference to them,
+    so agents and solutions can be sent to and from the workers without copying their Data.
+
+    :type data: Data
+    :param data: Data instance to pickle
+
+    :returns: tuple for reconstructing the Data instance
+    """
+    key = _shared_data_keys.get(id(data), id(data))
+    if _shared_data.get(key) is data:
+        return _get_shared_data, (key,)
+    return data.__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+
+
+class _SharedDataPickler(ForkingPickler):
+    """
+    Pickler for the queues of a Solver's pool, which pickles Data instances with _reduce_data.
+
+    The reducers are only added to this pickler's dispatch table,
+    so Data is pickled normally everywhere else multiprocessing pickles it (e.g. a user's Queue or Process).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dispatch_table[CSVData] = _reduce_data
+        self.dispatch_table[FJSData] = _reduce_data
+
+
+class _SharedDataQueue(SimpleQueue):
+    """
+    Queue between a Solver's pool and its worker processes that pickles with _SharedDataPickler.
+    """
+    def put(self, obj):
+        # serialize the object before acquiring the lock
+        obj = _SharedDataPickler.dumps(obj)
+        if self._wlock is None:
+            # writes to a message oriented win32 pipe are atomic
+            self._writer.send_bytes(obj)
+        else:
+            with self._wlock:
+                self._writer.send_bytes(obj)
+
+
+class _SharedDataPool(Pool):
+    """
+    Pool of worker processes whose tasks and results are sent through _SharedDataQueue instances.
+    """
+    def _setup_queues(self):
+        self._inqueue = _SharedDataQueue(ctx=self._ctx)
+        self._outqueue = _SharedDataQueue(ctx=self._ctx)
+        self._quick_put = self._inqueue.put
+        self._quick_get = self._outqueue._reader.recv
+
+
+def _init_worker(data_key, data):
+    """
+    Initializes a worker process of a Solver's pool.
+
+    Forked workers inherit the parent's numpy random state, so each worker is reseeded.
+    Spawned workers receive the Solver's Data pickled once, instead of once per agent.
+
+    :type data_key: int
+    :param data_key: key of the Solver's Data in _shared_data
+
+    :type data: Data | bytes
+    :param data: the Solver's Data, pickled if the worker was not forked
+
+    :returns: None
+    """
+    global _worker_data
+    np.random.seed()
+    if isinstance(data, bytes):
+        data = pickle.loads(data)
+        _shared_data_keys[id(data)] = data_key
+    _worker_data = data
+    _shared_data[data_key] = data
+
+
+def _start_agent(agent):
+    """
+    Runs an agent's search in a worker process of a Solver's pool.
+
+    :type agent: TabuSearchAgent | GeneticAlgorithmAgent
+    :param agent: agent to start
+
+    :rtype: TabuSearchAgent | GeneticAlgorithmAgent
+    :returns: the agent with its results
+    """
+    agent.start()
+    return agent
+
+
 class Solver:
     """
     The main solver class which calls tabu search and/or the genetic algorithm.
@@ -44,7 +211,52 @@ class Solver:
         self.solution = None
         self.ts_agent_list = None
         self.ga_agent = None
+        self.ga_agent_list = None
         self.solution_factory = SolutionFactory(data)
+        self._pool = None
+        self._pool_size = 0
+
+    def _get_pool(self, num_processes):
+        """
+        Gets the pool of worker processes, creating it if it does not exist or has a different number of processes.
+
+        The pool is kept between calls so repeated searches do not pay for starting new processes.
+        The workers are given the Solver's Data when they start, so it is not pickled with every agent.
+
+        :type num_processes: int
+        :param num_processes: number of worker processes in the pool
+
+        :rtype: multiprocessing.pool.Pool
+        :returns: pool of worker processes
+        """
+        if self._pool is None or self._pool_size != num_processes:
+            self.close()
+            _shared_data[id(self.data)] = self.data
+            if _mp_context.get_start_method() == 'fork':
+                initargs = (id(self.data), self.data)
+            else:
+                initargs = (id(self.data), pickle.dumps(self.data, pickle.HIGHEST_PROTOCOL))
+            self._pool = _SharedDataPool(num_processes, initializer=_init_worker, initargs=initargs,
+                                         context=_mp_context)
+            self._pool_size = num_processes
+
+        return self._pool
+
+    def close(self):
+        """
+        Shuts down the pool of worker processes if it exists.
+
+        :returns: None
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_size = 0
+
+    def __del__(self):
+        if getattr(self, '_pool', None) is not None:
+            self._pool.terminate()
 
     def tabu_search_time(self, runtime, num_solutions_per_process=1, num_processes=4, tabu_list_size=50,
                          neighborhood_size=300, neighborhood_wait=0.1, probability_change_machine=0.8,
@@ -53,9 +265,9 @@ class Solver:
         Performs parallel tabu search for a certain number of seconds.
 
         First the function generates random initial solutions if the initial_solutions parameter is None,
-        then it forks/spawns num_processes of child processes to run tabu search in parallel.
+        then it runs num_processes tabu searches in parallel on the Solver's pool of worker processes.
 
-        The parent process waits for the child processes to finish, then collects their results and updates self.solution.
+        The parent process waits for the tabu searches to finish, then collects their results and updates self.solution.
 
         :type runtime: float
         :param runtime: seconds that tabu search should run for
@@ -110,9 +322,9 @@ class Solver:
         Performs parallel tabu search for a certain number of iterations.
 
         First the function generates random initial solutions if the initial_solutions parameter is None,
-        then it forks a number of child processes to run tabu search.
+        then it runs a number of tabu searches in parallel on the Solver's pool of worker processes.
 
-        The parent process waits for the child processes to finish, then collects their results and updates self.solution.
+        The parent process waits for the tabu searches to finish, then collects their results and updates self.solution.
 
         :type iterations: int
         :param iterations: number of iterations for each tabu search to go through
@@ -164,9 +376,9 @@ class Solver:
         Performs parallel tabu search until the stopping condition is met.
 
         First the function generates random initial solutions if the initial_solutions parameter is None,
-        then it forks a number of child processes to run tabu search.
+        then it runs a number of tabu searches in parallel on the Solver's pool of worker processes.
 
-        The parent process waits for the child processes to finish, then collects their results and updates self.solution.
+        The parent process waits for the tabu searches to finish, then collects their results and updates self.solution.
 
         :type stopping_condition: float
         :param stopping_condition: either the duration in seconds or the number of iterations to search
@@ -210,11 +422,14 @@ class Solver:
         :rtype: Solution
         :returns: best solution found
         """
+        # only generate the initial solutions that were not supplied and never extend the caller's list
         if initial_solutions is None:
-            initial_solutions = [self.solution_factory.get_solution() for _ in range(num_processes)]
+            initial_solutions = self.solution_factory.get_n_solutions(num_processes)
+        elif len(initial_solutions) < num_processes:
+            initial_solutions = list(initial_solutions) + \
+                                self.solution_factory.get_n_solutions(num_processes - len(initial_solutions))
         else:
-            initial_solutions += [self.solution_factory.get_solution() for _ in
-                                  range(max(0, num_processes - len(initial_solutions)))]
+            initial_solutions = list(initial_solutions)
 
         ts_agent_list = [tabu_search.TabuSearchAgent(stopping_condition,
                                                      time_condition,
@@ -249,30 +464,18 @@ class Solver:
             print([round(x.makespan) for x in initial_solutions])
             print()
 
-        # create child processes to run tabu search
-        child_results_queue = mp.Queue()
-        processes = [
-            mp.Process(target=ts_agent.start, args=[child_results_queue])
-            for ts_agent in ts_agent_list
-        ]
-
-        # start child processes
-        for p in processes:
-            p.start()
-            if verbose:
-                print(f"child TS process started. pid = {p.pid}")
-
-        # start progress bar
-        if progress_bar and time_condition:
-            mp.Process(target=_run_progress_bar, args=[stopping_condition]).start()
+        # each agent gets its own worker process
+        pool = self._get_pool(len(ts_agent_list))
+        if verbose:
+            print(f"running {len(ts_agent_list)} TS agents in the worker pool")
 
-        # collect results from Queue and wait for child processes to finish
+        # collect results as the agents finish
         self.ts_agent_list = []
-        for p in processes:
-            self.ts_agent_list.append(pickle.loads(child_results_queue.get()))
-
-            if verbose:
-                print(f"child TS process finished. pid = {p.pid}")
+        with _progress_bar_thread(stopping_condition, progress_bar and time_condition):
+            for ts_agent in pool.imap_unordered(_start_agent, ts_agent_list):
+                self.ts_agent_list.append(ts_agent)
+                if verbose:
+                    print(f"TS agent finished. best makespan = {round(ts_agent.best_solution.makespan)}")
 
         self.solution = min([ts_agent.best_solution for ts_agent in self.ts_agent_list])
         return self.solution
@@ -280,7 +483,7 @@ class Solver:
     def genetic_algorithm_time(self, runtime, population=None, population_size=200,
                                selection_method_enum=genetic_algorithm.GASelectionEnum.TOURNAMENT,
                                mutation_probability=0.8, selection_size=10, benchmark=False, verbose=False,
-                               progress_bar=False):
+                               progress_bar=False, num_processes=1):
         """
         Performs the genetic algorithm for a certain number of seconds.
 
@@ -314,6 +517,9 @@ class Solver:
         :type progress_bar: bool
         :param progress_bar: if true a progress bar is spawned
 
+        :type num_processes: int
+        :param num_processes: number of GA islands to run in parallel, each one evolves an equal share of the population
+
         :rtype: Solution
         :returns: best solution found
         """
@@ -321,12 +527,12 @@ class Solver:
                                        population_size=population_size, selection_method_enum=selection_method_enum,
                                        mutation_probability=mutation_probability,
                                        selection_size=selection_size, benchmark=benchmark, verbose=verbose,
-                                       progress_bar=progress_bar)
+                                       progress_bar=progress_bar, num_processes=num_processes)
 
     def genetic_algorithm_iter(self, iterations, population=None, population_size=200,
                                selection_method_enum=genetic_algorithm.GASelectionEnum.TOURNAMENT,
                                mutation_probability=0.8,
-                               selection_size=10, benchmark=False, verbose=False):
+                               selection_size=10, benchmark=False, verbose=False, num_processes=1):
         """
         Performs the genetic algorithm for a certain number of generations.
 
@@ -357,6 +563,9 @@ class Solver:
         :type verbose: bool
         :param verbose: if true runs in verbose mode
 
+        :type num_processes: int
+        :param num_processes: number of GA islands to run in parallel, each one evolves an equal share of the population
+
         :rtype: Solution
         :returns: best solution found
         """
@@ -364,17 +573,22 @@ class Solver:
                                        population_size=population_size, selection_method_enum=selection_method_enum,
                                        mutation_probability=mutation_probability,
                                        selection_size=selection_size, benchmark=benchmark, verbose=verbose,
-                                       progress_bar=False)
+                                       progress_bar=False, num_processes=num_processes)
 
     def _genetic_algorithm(self, stopping_condition, time_condition, population=None, population_size=200,
                            selection_method_enum=genetic_algorithm.GASelectionEnum.TOURNAMENT, mutation_probability=0.8,
-                           selection_size=5, benchmark=False, verbose=False, progress_bar=False):
+                           selection_size=5, benchmark=False, verbose=False, progress_bar=False, num_processes=1):
         """
         Performs the genetic algorithm until the stopping condition is met.
 
         First this function generates a random initial population if the population parameter is None,
         then it runs GA with the parameters specified and updates self.solution.
 
+        If num_processes is greater than 1, the population is split into num_processes islands
+        that are evolved independently in parallel on the Solver's pool of worker processes,
+        self.ga_agent_list is set to the islands' agents and self.ga_agent is set to the agent with the best solution.
+        The number of islands is capped so that every island has more than selection_size solutions.
+
         :type stopping_condition: float
         :param stopping_condition: either the duration in seconds or the number of generations to iterate through
 
@@ -405,22 +619,34 @@ class Solver:
         :type progress_bar: bool
         :param progress_bar: if true a progress bar is spawned
 
+        :type num_processes: int
+        :param num_processes: number of GA islands to run in parallel, each one evolves an equal share of the population
+
         :rtype: Solution
         :returns: best solution found
+        :raise: ValueError if num_processes is less than 1
         """
+        if num_processes < 1:
+            raise ValueError(f"num_processes must be at least 1, got {num_processes}")
+
         if population is None:
             population = [self.solution_factory.get_solution() for _ in range(population_size)]
         else:
             population = population[:] + [self.solution_factory.get_solution() for _ in range(max(0, population_size - len(population)))]
 
-        self.ga_agent = genetic_algorithm.GeneticAlgorithmAgent(stopping_condition,
-                                                                population,
-                                                                time_condition,
-                                                                selection_method_enum,
-                                                                mutation_probability,
-                                                                selection_size,
-                                                                benchmark
-                                                                )
+        # split the population into one island per process,
+        # an island only breeds if it has more than selection_size solutions
+        num_processes = min(num_processes, max(1, len(population) // (selection_size + 1)))
+        ga_agent_list = [genetic_algorithm.GeneticAlgorithmAgent(stopping_condition,
+                                                                 population[i::num_processes],
+                                                                 time_condition,
+                                                                 selection_method_enum,
+                                                                 mutation_probability,
+                                                                 selection_size,
+                                                                 benchmark
+                                                                 )
+                         for i in range(num_processes)
+                         ]
 
         if verbose:
             if benchmark:
@@ -435,11 +661,20 @@ class Solver:
             print("mutation_probability =", mutation_probability)
             if selection_method_enum is genetic_algorithm.GASelectionEnum.TOURNAMENT:
                 print("selection_size =", selection_size)
+            print("num_processes =", num_processes)
 
-        if progress_bar and time_condition:
-            mp.Process(target=_run_progress_bar, args=[stopping_condition]).start()
+        # the pool is created before the progress bar thread is started so no thread is running when it forks
+        pool = self._get_pool(num_processes) if num_processes > 1 else None
+
+        with _progress_bar_thread(stopping_condition, progress_bar and time_condition):
+            if pool is None:
+                ga_agent_list[0].start()
+                self.ga_agent_list = ga_agent_list
+            else:
+                self.ga_agent_list = list(pool.imap_unordered(_start_agent, ga_agent_list))
 
-        self.solution = self.ga_agent.start()
+        self.ga_agent = min(self.ga_agent_list, key=lambda ga_agent: ga_agent.best_solution)
+        self.solution = self.ga_agent.best_solution
         return self.solution
 
     def output_benchmark_results(self, output_dir, title=None, auto_open=True):
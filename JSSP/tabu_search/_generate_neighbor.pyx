@@ -1,4 +1,5 @@
 from ..solution import Solution
+from ..solution._makespan cimport compute_machine_makespans
 cimport cython
 import numpy as np
 cimport numpy as np
@@ -11,6 +12,9 @@ cpdef generate_neighbor(solution, double probability_change_machine, int[:, ::1]
     """
     Generates a Solution instance that is a neighbor of the solution parameter.
 
+    The machine makespans of the neighbor are computed here with a direct C call to the makespan kernel
+    while the neighbor's operations are still in cache, so the Solution does not compute them again.
+
     :type solution: Solution
     :param solution: solution to generate a neighbor of
     
@@ -25,12 +29,12 @@ cpdef generate_neighbor(solution, double probability_change_machine, int[:, ::1]
     
     :rtype: Solution
     :returns: neighbor of the solution parameter
+    :raise: InfeasibleSolutionException if the neighbor is infeasible
     """
-    cdef int[:, ::1] result_operation_2d_array = np.copy(solution.operation_2d_array)
-    cdef int[::1] operation, usable_machines
-    cdef Py_ssize_t random_index, lower_index, upper_index, placement_index, min_machine_makespan, i
-    cdef int job_id, sequence
-    cdef double[::1] makespans
+    result = np.copy(solution.operation_2d_array)
+    cdef int[:, ::1] result_operation_2d_array = result
+    cdef Py_ssize_t random_index, lower_index, upper_index, placement_index, i, k
+    cdef int job_id, task_id, sequence, machine
     lower_index = 0
     upper_index = 0
 
@@ -38,9 +42,8 @@ cpdef generate_neighbor(solution, double probability_change_machine, int[:, ::1]
     while lower_index >= upper_index:
 
         random_index = np.random.randint(0, result_operation_2d_array.shape[0])
-        operation = result_operation_2d_array[random_index]
-        job_id = operation[0]
-        sequence = operation[2]
+        job_id = result_operation_2d_array[random_index, 0]
+        sequence = result_operation_2d_array[random_index, 2]
 
         # find a lower bound for possible placement of the operation
         lower_index = random_index - 1
@@ -61,7 +64,8 @@ cpdef generate_neighbor(solution, double probability_change_machine, int[:, ::1]
         else:
             upper_index = upper_index - 1
 
-    result_operation_2d_array = np.delete(result_operation_2d_array, random_index, axis=0)
+    task_id = result_operation_2d_array[random_index, 1]
+    machine = result_operation_2d_array[random_index, 3]
 
     # get a random placement index that is in between lower and upper index (bounds) and not equal to the random index
     placement_index = random_index
@@ -70,7 +74,25 @@ cpdef generate_neighbor(solution, double probability_change_machine, int[:, ::1]
 
     # randomly change operation's machine if probability condition is met
     if np.random.random_sample() < probability_change_machine:
-        i = dependency_matrix_index_encoding[operation[0], operation[1]]
-        operation[3] = np.random.choice(usable_machines_matrix[i])
+        i = dependency_matrix_index_encoding[job_id, task_id]
+        machine = np.random.choice(usable_machines_matrix[i])
+
+    # move the operation to the placement index by shifting the operations in between one row towards the
+    # random index, this is equivalent to deleting it and inserting it again but without allocating new arrays
+    if placement_index < random_index:
+        for k in range(random_index, placement_index, -1):
+            result_operation_2d_array[k, :] = result_operation_2d_array[k - 1, :]
+    else:
+        for k in range(random_index, placement_index):
+            result_operation_2d_array[k, :] = result_operation_2d_array[k + 1, :]
+
+    result_operation_2d_array[placement_index, 0] = job_id
+    result_operation_2d_array[placement_index, 1] = task_id
+    result_operation_2d_array[placement_index, 2] = sequence
+    result_operation_2d_array[placement_index, 3] = machine
 
-    return Solution(solution.data, np.insert(result_operation_2d_array, placement_index, operation, axis=0))
+    data = solution.data
+    return Solution(data, result, compute_machine_makespans(result_operation_2d_array,
+                                                            data.task_processing_times_matrix,
+                                                            data.sequence_dependency_matrix,
+                                                            data.job_task_index_matrix))
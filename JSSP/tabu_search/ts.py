@@ -1,5 +1,4 @@
 import heapq
-import pickle
 import random
 import time
 
@@ -74,9 +73,9 @@ class TabuSearchAgent:
         if benchmark:
             # uninitialized ts benchmark results
             self.benchmark_iterations = 0
-            self.neighborhood_size_v_iter = []
-            self.seed_solution_makespan_v_iter = []
-            self.tabu_size_v_iter = []
+            self.neighborhood_size_v_iter = np.empty(0, dtype=np.int64)
+            self.seed_solution_makespan_v_iter = np.empty(0, dtype=np.float64)
+            self.tabu_size_v_iter = np.empty(0, dtype=np.int64)
             self.min_makespan_coordinates = (0, 0)
 
     def _generate_neighborhood(self, seed_solution, dependency_matrix_index_encoding, usable_machines_matrix):
@@ -225,15 +224,16 @@ class TabuSearchAgent:
 
         if self.benchmark:
             self.benchmark_iterations = iterations
-            self.neighborhood_size_v_iter = neighborhood_size_v_iter
-            self.seed_solution_makespan_v_iter = seed_solution_makespan_v_iter
-            self.tabu_size_v_iter = tabu_size_v_iter
+            # store the traces as ndarrays so they are pickled and plotted as single buffers
+            self.neighborhood_size_v_iter = np.array(neighborhood_size_v_iter, dtype=np.int64)
+            self.seed_solution_makespan_v_iter = np.array(seed_solution_makespan_v_iter, dtype=np.float64)
+            self.tabu_size_v_iter = np.array(tabu_size_v_iter, dtype=np.int64)
             self.min_makespan_coordinates = (absolute_best_solution_iteration, absolute_best_solution_makespan)
 
         if multi_process_queue is not None:
-            # pickle results and add to Queue
+            # add results to Queue, which pickles this agent once on its feeder thread
             self.initial_solution.machine_makespans = np.asarray(self.initial_solution.machine_makespans)
-            multi_process_queue.put(pickle.dumps(self, protocol=-1))
+            multi_process_queue.put(self)
 
         return self.best_solution
 
@@ -178,6 +178,44 @@ class TestGA(unittest.TestCase):
         solver.output_benchmark_results(output_file, auto_open=False)
         self.assertTrue(output_file.exists(), "GA benchmark results were not produced")
 
+    def test_ga_iter_islands(self):
+        iterations = 20
+        population_size = 100
+        num_processes = 2
+
+        solver = Solver(csv_data)
+        solver.genetic_algorithm_iter(iterations=iterations,
+                                      population_size=population_size,
+                                      selection_size=5,
+                                      num_processes=num_processes)
+        solver.close()
+
+        self.assertIsNotNone(solver.solution)
+        self.assertEqual(num_processes, len(solver.ga_agent_list))
+        self.assertIn(solver.ga_agent, solver.ga_agent_list)
+        self.assertEqual(solver.solution, min(ga_agent.best_solution for ga_agent in solver.ga_agent_list))
+
+        # each island evolves an equal share of the population
+        for ga_agent in solver.ga_agent_list:
+            self.assertEqual(iterations, ga_agent.iterations)
+            self.assertEqual(population_size // num_processes, ga_agent.population_size)
+            self.assertEqual(len(ga_agent.initial_population), len(ga_agent.result_population))
+
+    def test_ga_iter_islands_small_population(self):
+        solver = Solver(csv_data)
+        solver.genetic_algorithm_iter(iterations=20, population_size=24, selection_size=5, num_processes=8)
+        solver.close()
+
+        # the islands are capped so that each one has more than selection_size solutions and evolves
+        self.assertEqual(4, len(solver.ga_agent_list))
+        for ga_agent in solver.ga_agent_list:
+            self.assertGreater(len(ga_agent.initial_population), 5)
+            self.assertLess(ga_agent.best_solution, min(ga_agent.initial_population),
+                            "every island should improve on its initial population")
+
+        with self.assertRaises(ValueError):
+            solver.genetic_algorithm_iter(iterations=5, population_size=3, num_processes=0)
+
 
 class TestGASelectionMethods(unittest.TestCase):
 
@@ -1,9 +1,19 @@
+import multiprocessing as mp
+import threading
 import unittest
 
+from JSSP.benchmark_plotter import _make_ts_traces
+from JSSP.solution import Solution
 from JSSP.solver import Solver
 from tests.util import tmp_dir, csv_data, rm_tree
 
 
+def _recompute_makespan(solution_queue, makespan_queue):
+    # recomputing the makespan needs the solution's full Data, not a reference to a Solver's pool
+    solution = solution_queue.get()
+    makespan_queue.put(Solution(solution.data, solution.operation_2d_array).makespan)
+
+
 class TestTS(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -233,6 +243,75 @@ class TestTS(unittest.TestCase):
                 self.assertEqual(len(all_solutions), num_processes * num_solutions_per_process,
                                  f"Parallel TS should have produced {num_processes * num_solutions_per_process} solutions")
 
+    def test_ts_initial_solutions(self):
+        solver = Solver(csv_data)
+        initial_solutions = [solver.solution_factory.get_solution()]
+
+        solver.tabu_search_iter(10, num_processes=2, neighborhood_size=50, initial_solutions=initial_solutions)
+        self.assertEqual(len(solver.ts_agent_list), 2, "missing initial solutions should be generated")
+        self.assertEqual(len(initial_solutions), 1, "the caller's initial solutions should not be extended")
+
+        initial_solutions = solver.solution_factory.get_n_solutions(3)
+        solver.tabu_search_iter(10, num_processes=2, neighborhood_size=50, initial_solutions=initial_solutions)
+        self.assertEqual(len(solver.ts_agent_list), 3, "every supplied initial solution should get an agent")
+        solver.close()
+
+    def test_ts_reuses_worker_pool(self):
+        solver = Solver(csv_data)
+        solver.tabu_search_iter(10, num_processes=2, neighborhood_size=50)
+        pool = solver._pool
+
+        solver.tabu_search_iter(10, num_processes=2, neighborhood_size=50)
+        self.assertIs(pool, solver._pool, "worker pool should be reused for the same number of processes")
+        self.assertEqual(len(solver.ts_agent_list), 2)
+
+        solver.tabu_search_iter(10, num_processes=3, neighborhood_size=50)
+        self.assertIsNot(pool, solver._pool, "worker pool should be recreated for a different number of processes")
+        self.assertEqual(len(solver.ts_agent_list), 3)
+
+        solver.close()
+        self.assertIsNone(solver._pool)
+
+    def test_ts_worker_results_share_data(self):
+        solver = Solver(csv_data)
+        solver.tabu_search_iter(10, num_processes=2, neighborhood_size=50)
+        solver.close()
+
+        for ts_agent in solver.ts_agent_list:
+            self.assertIs(ts_agent.best_solution.data, csv_data,
+                          "solutions from the workers should reference the Solver's Data instead of a copy")
+
+    def test_ts_traces_without_agents(self):
+        makespans_traces = _make_ts_traces([])[0]
+        self.assertEqual(1, len(makespans_traces))
+        self.assertEqual((), makespans_traces[0].x)
+        self.assertEqual((), makespans_traces[0].y)
+
+    def test_ts_progress_bar_thread_is_joined(self):
+        solver = Solver(csv_data)
+        solver.tabu_search_time(1, num_processes=2, neighborhood_size=50, progress_bar=True)
+        solver.close()
+
+        self.assertNotIn('progress bar', [thread.name for thread in threading.enumerate()],
+                         "the progress bar thread should be stopped before the search returns")
+
+    def test_ts_solution_through_spawned_process_queue(self):
+        solver = Solver(csv_data)
+        solver.tabu_search_iter(10, num_processes=2, neighborhood_size=50)
+        solver.close()
+
+        ctx = mp.get_context('spawn')
+        solution_queue = ctx.Queue()
+        makespan_queue = ctx.Queue()
+        process = ctx.Process(target=_recompute_makespan, args=(solution_queue, makespan_queue))
+        process.start()
+        solution_queue.put(solver.solution)
+        makespan = makespan_queue.get(timeout=120)
+        process.join()
+
+        self.assertEqual(0, process.exitcode)
+        self.assertEqual(solver.solution.makespan, makespan)
+
 
 if __name__ == '__main__':
     unittest.main()
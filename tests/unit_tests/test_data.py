@@ -1,8 +1,14 @@
+import os
+import pickle
+import shutil
+import subprocess
+import sys
 import unittest
 
 import numpy as np
 
 from JSSP import data
+from JSSP.solution import SolutionFactory
 from tests.util import project_root, tmp_dir, get_files_with_suffix, rm_tree
 
 
@@ -23,7 +29,7 @@ class TestData(unittest.TestCase):
         self.assertIsNotNone(csv_data.task_processing_times_matrix)
         self.assertIsNotNone(csv_data.machine_speeds)
 
-        self.assertNotEqual([], csv_data.jobs)
+        self.assertNotEqual((), csv_data.jobs)
         self.assertIsNotNone(csv_data.total_number_of_jobs)
         self.assertIsNotNone(csv_data.total_number_of_tasks)
         self.assertIsNotNone(csv_data.total_number_of_machines)
@@ -44,7 +50,7 @@ class TestData(unittest.TestCase):
         self.assertIsNotNone(csv_data.task_processing_times_matrix)
         self.assertIsNotNone(csv_data.machine_speeds)
 
-        self.assertNotEqual([], csv_data.jobs)
+        self.assertNotEqual((), csv_data.jobs)
         self.assertIsNotNone(csv_data.total_number_of_jobs)
         self.assertIsNotNone(csv_data.total_number_of_tasks)
         self.assertIsNotNone(csv_data.total_number_of_machines)
@@ -63,12 +69,116 @@ class TestData(unittest.TestCase):
             self.assertIsNotNone(fjs_data.usable_machines_matrix)
             self.assertIsNotNone(fjs_data.task_processing_times_matrix)
 
-            self.assertNotEqual([], fjs_data.jobs)
+            self.assertNotEqual((), fjs_data.jobs)
             self.assertIsNotNone(fjs_data.total_number_of_jobs)
             self.assertIsNotNone(fjs_data.total_number_of_tasks)
             self.assertIsNotNone(fjs_data.total_number_of_machines)
             self.assertIsNotNone(fjs_data.max_tasks_for_a_job)
 
+    def test_usable_machines_bitmask(self):
+        csv_data = data.CSVData(
+            project_root / 'data/given_data/sequenceDependencyMatrix.csv',
+            project_root / 'data/given_data/machineRunSpeed.csv',
+            project_root / 'data/given_data/jobTasks.csv')
+
+        for job in csv_data.jobs:
+            for task in job.get_tasks():
+                task_index = csv_data.job_task_index_matrix[task.get_job_id(), task.get_task_id()]
+                for machine in range(csv_data.total_number_of_machines):
+                    self.assertEqual(machine in task.get_usable_machines(),
+                                     csv_data.is_machine_usable(task_index, machine))
+
+                # legacy usable_machines_matrix row should only contain the task's usable machines
+                self.assertEqual(set(task.get_usable_machines()), set(csv_data.usable_machines_matrix[task_index]))
+
+    def test_get_setup_time(self):
+        csv_data = data.CSVData(
+            project_root / 'data/given_data/sequenceDependencyMatrix.csv',
+            project_root / 'data/given_data/machineRunSpeed.csv',
+            project_root / 'data/given_data/jobTasks.csv')
+
+        for job1_id, job1_task_id, job2_id, job2_task_id in [(-1, -1, 0, 0), (0, 0, -1, 0), (1, -1, 1, 0)]:
+            self.assertEqual(0, csv_data.get_setup_time(job1_id, job1_task_id, job2_id, job2_task_id))
+
+        self.assertEqual(csv_data.sequence_dependency_matrix[csv_data.job_task_index_matrix[0, 1],
+                                                             csv_data.job_task_index_matrix[1, 0]],
+                         csv_data.get_setup_time(0, 1, 1, 0))
+
+    def test_tasks_can_use(self):
+        fjs_data = data.FJSData(project_root / 'data/fjs_data/Barnes/Barnes_mt10c1.fjs')
+        task_indices, machines = np.meshgrid(np.arange(fjs_data.total_number_of_tasks),
+                                             np.arange(fjs_data.total_number_of_machines), indexing='ij')
+
+        np.testing.assert_array_equal(fjs_data.task_processing_times_matrix != np.inf,
+                                      fjs_data.tasks_can_use(task_indices.ravel(), machines.ravel()).reshape(
+                                          task_indices.shape))
+
+    def test_edge_list(self):
+        fjs_data = data.FJSData(project_root / 'data/fjs_data/Barnes/Barnes_mt10c1.fjs')
+
+        for task_index in range(fjs_data.total_number_of_tasks):
+            start, end = fjs_data.task_offsets[task_index], fjs_data.task_offsets[task_index + 1]
+            usable_machines = np.flatnonzero(fjs_data.task_processing_times_matrix[task_index] != np.inf)
+
+            np.testing.assert_array_equal(usable_machines, fjs_data.get_usable_machines(task_index))
+            np.testing.assert_array_equal(task_index, fjs_data.edge_task[start:end])
+            np.testing.assert_array_equal(fjs_data.task_processing_times_matrix[task_index, usable_machines],
+                                          fjs_data.edge_runtime[start:end])
+
+    def test_task_arrays(self):
+        csv_data = data.CSVData(
+            project_root / 'data/given_data/sequenceDependencyMatrix.csv',
+            project_root / 'data/given_data/machineRunSpeed.csv',
+            project_root / 'data/given_data/jobTasks.csv')
+
+        for job in csv_data.jobs:
+            for task in job.get_tasks():
+                task_index = csv_data.job_task_index_matrix[task.job_id, task.task_id]
+                self.assertEqual(task.job_id, csv_data.task_job_ids[task_index])
+                self.assertEqual(task.task_id, csv_data.task_ids[task_index])
+                self.assertEqual(task.sequence, csv_data.task_sequences[task_index])
+                self.assertEqual(task.pieces, csv_data.task_pieces[task_index])
+
+    def test_task_and_job_hash(self):
+        task = data.Task(0, 1, 1, np.array([2, 5], dtype=np.intc), 10)
+        same_task = data.Task(0, 1, 1, [2, 5], -1)  # pieces are not compared
+        other_task = data.Task(0, 1, 1, [5, 2], 10)
+
+        self.assertEqual(task, same_task)
+        self.assertEqual(hash(task), hash(same_task))
+        self.assertNotEqual(task, other_task)
+        self.assertEqual(1, len({task, same_task}))
+
+        jobs = []
+        for tasks in ([task], [same_task], [other_task]):
+            job = data.Job(0)
+            job.get_tasks().extend(tasks)
+            job.set_max_sequence(1)
+            jobs.append(job)
+
+        self.assertEqual(jobs[0], jobs[1])
+        self.assertEqual(hash(jobs[0]), hash(jobs[1]))
+        self.assertNotEqual(jobs[0], jobs[2])
+
+    def test_task_and_job_pickle(self):
+        # pickle the task in a process with a different hash seed, like a spawned worker process
+        code = "import pickle, sys; from JSSP import data; " \
+               "sys.stdout.buffer.write(pickle.dumps(data.Task(0, 1, 1, [2, 5], 10)))"
+        pickled_task = subprocess.run([sys.executable, '-c', code], cwd=str(project_root), check=True,
+                                      stdout=subprocess.PIPE, env=dict(os.environ, PYTHONHASHSEED='1')).stdout
+
+        task = pickle.loads(pickled_task)
+        same_task = data.Task(0, 1, 1, [2, 5], 10)
+        self.assertEqual(task, same_task)
+        self.assertEqual(hash(task), hash(same_task))
+        self.assertEqual(1, len({task, same_task}))
+
+        job = data.Job(0)
+        job.get_tasks().append(same_task)
+        unpickled_job = pickle.loads(pickle.dumps(job))
+        unpickled_job.get_tasks()[0] = task
+        self.assertEqual(job, unpickled_job)
+
     def test_attempt_create_base_class_data(self):
         try:
             data.Data()
@@ -107,7 +217,7 @@ class TestFJSConversionToCSV(unittest.TestCase):
             data.Data.convert_fjs_to_csv(fjs_instance, tmp_dir)
 
             # read in converted csv file
-            csv_data = data.CSVData(tmp_dir / 'sequenceDependencyMatrix.csv',
+            csv_data = data.CSVData(tmp_dir / 'sequenceDependencyMatrix.npy',
                                     tmp_dir / 'machineRunSpeed.csv',
                                     tmp_dir / 'jobTasks.csv')
 
@@ -135,5 +245,131 @@ class TestFJSConversionToCSV(unittest.TestCase):
                              f'max tasks for a job are not equal for {fjs_instance}')
 
 
+class TestReadFJSFile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        if not tmp_dir.exists():
+            tmp_dir.mkdir()
+
+    def tearDown(self) -> None:
+        rm_tree(tmp_dir)
+
+    def test_read_fjs_file(self):
+        fjs_file = tmp_dir / 'instance.fjs'
+        with open(fjs_file, 'w') as fout:
+            fout.write("\n  2 3 1.5\n2 1 1 3 2 2 4 3 5\n 1 1 2 7 \n\n")
+
+        self.assertEqual((2, 3, [2, 1, 1, 3, 2, 2, 4, 3, 5, 1, 1, 2, 7]), data._read_fjs_file(fjs_file))
+
+
+class TestDataCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        if not tmp_dir.exists():
+            tmp_dir.mkdir()
+
+    def tearDown(self) -> None:
+        rm_tree(tmp_dir)
+
+    def assert_data_equal(self, expected, actual):
+        for name in data._CACHED_ARRAYS:
+            np.testing.assert_array_equal(getattr(expected, name), getattr(actual, name),
+                                          err_msg=f'{name} is not equal')
+
+        np.testing.assert_array_equal(expected.usable_machines_matrix, actual.usable_machines_matrix)
+        self.assertEqual(expected.jobs, actual.jobs)
+        self.assertEqual(expected.total_number_of_jobs, actual.total_number_of_jobs)
+        self.assertEqual(expected.total_number_of_tasks, actual.total_number_of_tasks)
+        self.assertEqual(expected.total_number_of_machines, actual.total_number_of_machines)
+        self.assertEqual(expected.max_tasks_for_a_job, actual.max_tasks_for_a_job)
+
+    def test_csv_data_cache(self):
+        files = (project_root / 'data/given_data/sequenceDependencyMatrix.csv',
+                 project_root / 'data/given_data/machineRunSpeed.csv',
+                 project_root / 'data/given_data/jobTasks.csv')
+
+        csv_data = data.CSVData(*files, cache_dir=tmp_dir)
+        self.assertEqual(1, len(list(tmp_dir.glob('*.npz'))))
+
+        # second instance should be loaded from the cache file
+        cached_csv_data = data.CSVData(*files, cache_dir=tmp_dir)
+        self.assert_data_equal(csv_data, cached_csv_data)
+        self.assertFalse(cached_csv_data.sequence_dependency_matrix.flags.writeable)
+
+        # the cache file is written to a temporary file that replaces it, so no temporary files are left
+        self.assertEqual([], [path for path in tmp_dir.iterdir() if path.suffix != '.npz'])
+
+    def test_sequence_dependency_matrix_npy_cache(self):
+        given_data = project_root / 'data/given_data'
+        seq_dep_matrix_file = tmp_dir / 'sequenceDependencyMatrix.csv'
+        shutil.copy(str(given_data / 'sequenceDependencyMatrix.csv'), str(seq_dep_matrix_file))
+
+        csv_data = data.CSVData(seq_dep_matrix_file, given_data / 'machineRunSpeed.csv', given_data / 'jobTasks.csv')
+        self.assertTrue((tmp_dir / 'sequenceDependencyMatrix.npy').exists())
+        self.assertFalse(csv_data.sequence_dependency_matrix.flags.writeable)
+
+        # the .npy and stamp files get the default permissions instead of the temporary file's 0600
+        if os.name != 'nt':
+            for name in ('sequenceDependencyMatrix.npy', 'sequenceDependencyMatrix.npy.stamp'):
+                self.assertEqual(0o666 & ~data._UMASK, (tmp_dir / name).stat().st_mode & 0o777)
+
+        # second instance should memory map the saved .npy file
+        cached_csv_data = data.CSVData(seq_dep_matrix_file, given_data / 'machineRunSpeed.csv',
+                                       given_data / 'jobTasks.csv')
+        self.assertIsInstance(cached_csv_data.sequence_dependency_matrix, np.memmap)
+        np.testing.assert_array_equal(csv_data.sequence_dependency_matrix, cached_csv_data.sequence_dependency_matrix)
+
+        # a changed csv file should be parsed again even if its modification time is not newer than the .npy file
+        csv_stat = seq_dep_matrix_file.stat()
+        with open(seq_dep_matrix_file) as fin:
+            lines = fin.readlines()
+        row = lines[1].split(',')
+        old_value = cached_csv_data.sequence_dependency_matrix[0, 0]
+        row[1] = str(old_value + 1000)
+        lines[1] = ','.join(row)
+        with open(seq_dep_matrix_file, 'w') as fout:
+            fout.writelines(lines)
+        os.utime(str(seq_dep_matrix_file), ns=(csv_stat.st_atime_ns, csv_stat.st_mtime_ns))
+
+        csv_data = data.CSVData(seq_dep_matrix_file, given_data / 'machineRunSpeed.csv', given_data / 'jobTasks.csv')
+        self.assertNotIsInstance(csv_data.sequence_dependency_matrix, np.memmap)
+        self.assertEqual(old_value + 1000, csv_data.sequence_dependency_matrix[0, 0])
+
+        # the .npy file is replaced, so the instance that still maps the old file keeps the old values
+        self.assertEqual(old_value, cached_csv_data.sequence_dependency_matrix[0, 0])
+        cached_csv_data = data.CSVData(seq_dep_matrix_file, given_data / 'machineRunSpeed.csv',
+                                       given_data / 'jobTasks.csv')
+        self.assertIsInstance(cached_csv_data.sequence_dependency_matrix, np.memmap)
+        self.assertEqual(old_value + 1000, cached_csv_data.sequence_dependency_matrix[0, 0])
+
+    def test_sequence_dependency_matrix_int64_npy_file(self):
+        given_data = project_root / 'data/given_data'
+        csv_data = data.CSVData(given_data / 'sequenceDependencyMatrix.csv', given_data / 'machineRunSpeed.csv',
+                                given_data / 'jobTasks.csv')
+        seq_dep_matrix_file = tmp_dir / 'sequenceDependencyMatrix.npy'
+        np.save(seq_dep_matrix_file, csv_data.sequence_dependency_matrix.astype(np.int64))
+
+        npy_data = data.CSVData(seq_dep_matrix_file, given_data / 'machineRunSpeed.csv', given_data / 'jobTasks.csv')
+        self.assertEqual(np.intc, npy_data.sequence_dependency_matrix.dtype)
+        self.assertTrue(npy_data.sequence_dependency_matrix.flags.c_contiguous)
+        self.assertFalse(npy_data.sequence_dependency_matrix.flags.writeable)
+        np.testing.assert_array_equal(csv_data.sequence_dependency_matrix, npy_data.sequence_dependency_matrix)
+        self.assertIsNotNone(SolutionFactory(npy_data).get_solution())
+
+        np.save(seq_dep_matrix_file, csv_data.sequence_dependency_matrix.astype(np.float64))
+        with self.assertRaises(ValueError):
+            data.CSVData(seq_dep_matrix_file, given_data / 'machineRunSpeed.csv', given_data / 'jobTasks.csv')
+
+    def test_fjs_data_cache(self):
+        fjs_instance = project_root / 'data/fjs_data/Brandimarte/Brandimarte_Mk10.fjs'
+
+        fjs_data = data.FJSData(fjs_instance, cache_dir=tmp_dir)
+        self.assertEqual(1, len(list(tmp_dir.glob('*.npz'))))
+
+        cached_fjs_data = data.FJSData(fjs_instance, cache_dir=tmp_dir)
+        self.assertIsNone(cached_fjs_data.machine_speeds)
+        self.assert_data_equal(fjs_data, cached_fjs_data)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 import random
 import unittest
 
+import numpy as np
+
 from JSSP import data
 from JSSP.exception import InfeasibleSolutionException
 from JSSP.solution.factory import _MaxHeapObj, _MinHeapObj, _JobTaskHeap, SolutionFactory
@@ -38,7 +40,7 @@ class TestHeap(unittest.TestCase):
 
             processing_times = [processing_time for processing_time in
                                 csv_data.task_processing_times_matrix[task_index] if
-                                processing_time != -1]
+                                processing_time != np.inf]
 
             avg_processing_time = sum(processing_times) / len(processing_times)
             tmp_list.append((task, avg_processing_time))
@@ -59,7 +61,7 @@ class TestHeap(unittest.TestCase):
 
             processing_times = [processing_time for processing_time in
                                 csv_data.task_processing_times_matrix[task_index] if
-                                processing_time != -1]
+                                processing_time != np.inf]
 
             avg_processing_time = sum(processing_times) / len(processing_times)
             tmp_list.append((task, avg_processing_time))
@@ -15,8 +15,8 @@ class TestMakespan(unittest.TestCase):
         with open(self.operation_matrices_dir / 'operation_matrix1.pkl', 'rb') as fin:
             operation_matrix = pickle.load(fin)
 
-        machine_makespans = [7996.268342767385, 8398.781671526705, 8343.87056502593, 6924.5613419194015,
-                             7787.349643580393, 7397.651671526705, 8520.94199359736, 6546.192632325946]
+        machine_makespans = [7996.2683181762695, 8398.781635284424, 8343.87057876587, 6924.561309814453,
+                             7787.3496170043945, 7397.6516456604, 8520.94200515747, 6546.1926193237305]
 
         self.assertEqual(machine_makespans, list(compute_machine_makespans(operation_matrix,
                                                                            csv_data.task_processing_times_matrix,
@@ -27,8 +27,8 @@ class TestMakespan(unittest.TestCase):
         with open(self.operation_matrices_dir / 'operation_matrix2.pkl', 'rb') as fin:
             operation_matrix = pickle.load(fin)
 
-        machine_makespans = [7164.847326846639, 7826.668527368575, 7298.214357227469, 6836.4973312287375,
-                             6670.195475155797, 7201.790941161678, 6566.151253038424, 6003.240322893379]
+        machine_makespans = [7164.847328186035, 7826.668571472168, 7298.21435546875, 6836.497337341309,
+                             6670.195472717285, 7201.790977478027, 6566.151252746582, 6003.240329742432]
 
         self.assertEqual(machine_makespans, list(compute_machine_makespans(operation_matrix,
                                                                            csv_data.task_processing_times_matrix,
@@ -39,8 +39,8 @@ class TestMakespan(unittest.TestCase):
         with open(self.operation_matrices_dir / 'operation_matrix3.pkl', 'rb') as fin:
             operation_matrix = pickle.load(fin)
 
-        machine_makespans = [5622.211909610022, 6668.672413793104, 6198.45099818512, 7328.462489909265,
-                             5576.7756781282205, 6459.11152450091, 6441.177636208749, 6614.8161680749035]
+        machine_makespans = [5622.211868286133, 6668.672416687012, 6198.450958251953, 7328.462455749512,
+                             5576.775630950928, 6459.111473083496, 6441.177589416504, 6614.8161697387695]
 
         self.assertEqual(machine_makespans, list(compute_machine_makespans(operation_matrix,
                                                                            csv_data.task_processing_times_matrix,
@@ -51,8 +51,8 @@ class TestMakespan(unittest.TestCase):
         with open(self.operation_matrices_dir / 'operation_matrix4.pkl', 'rb') as fin:
             operation_matrix = pickle.load(fin)
 
-        machine_makespans = [9989.582752327537, 10803.08454507686, 9811.387630376317, 7800.677606979643,
-                             7691.085943026534, 10134.502752327537, 9078.174622487135, 9977.302745579258]
+        machine_makespans = [9989.582786560059, 10803.084587097168, 9811.387657165527, 7800.677673339844,
+                             7691.085998535156, 10134.502784729004, 9078.174667358398, 9977.302772521973]
 
         self.assertEqual(machine_makespans, list(compute_machine_makespans(operation_matrix,
                                                                            csv_data.task_processing_times_matrix,
@@ -63,8 +63,8 @@ class TestMakespan(unittest.TestCase):
         with open(self.operation_matrices_dir / 'operation_matrix5.pkl', 'rb') as fin:
             operation_matrix = pickle.load(fin)
 
-        machine_makespans = [7887.918413494386, 8837.07330635202, 8506.797444283055, 7980.680300819141,
-                             8334.323760072528, 7838.29338568095, 7910.037297677689, 7943.372792640731]
+        machine_makespans = [7887.91841506958, 8837.073261260986, 8506.797412872314, 7980.680294036865,
+                             8334.323734283447, 7838.293388366699, 7910.037292480469, 7943.372791290283]
 
         self.assertEqual(machine_makespans, list(compute_machine_makespans(operation_matrix,
                                                                            csv_data.task_processing_times_matrix,
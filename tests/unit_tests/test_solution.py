@@ -16,6 +16,14 @@ class TestSolution(unittest.TestCase):
 
         self.assertEqual(solution_obj1, solution_obj2, "These two solution.Solutions should be equal")
 
+    def test_solution_precomputed_machine_makespans(self):
+        solution_obj1 = solution.SolutionFactory(csv_data).get_solution()
+        solution_obj2 = solution.Solution(csv_data, solution_obj1.operation_2d_array,
+                                          machine_makespans=solution_obj1.machine_makespans)
+
+        self.assertEqual(solution_obj1.makespan, solution_obj2.makespan)
+        self.assertIs(solution_obj1.machine_makespans, solution_obj2.machine_makespans)
+
     def test_solution_inequality(self):
         solution_obj1 = solution.SolutionFactory(csv_data).get_solution()
         solution_obj2 = solution.SolutionFactory(csv_data).get_solution()